@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+from itertools import chain, repeat
+from typing import Iterable, Iterator
+
+from n2t.core.assembler.ir import Kind, Program, Statement, statements
+
+PARALLEL_THRESHOLD = 1 << 15
+CHUNKS_PER_WORKER = 4
 
 
 @dataclass
 class Assembler:
+    threshold: int = PARALLEL_THRESHOLD
+    workers: int | None = None
+
     @classmethod
-    def create(cls) -> Assembler:
-        return cls()
+    def create(
+        cls, threshold: int = PARALLEL_THRESHOLD, workers: int | None = None
+    ) -> Assembler:
+        return cls(threshold, workers)
 
     symbol_table = {
         "R0": 0,
@@ -87,98 +100,64 @@ class Assembler:
         "JMP": "111",
     }
 
-    def get_assembly_size(self, assembly: Iterable[str]) -> int:
-        res: int = 0
-        for line in assembly:
-            line = line.replace(" ", "")
-            if line == "":
-                continue
-            if line[0] != "/" and (
-                line.find("@") != -1 or line.find("=") != -1 or line.find(";") != -1
-            ):
-                res += 1
-        return res
-
-    def build_label_table(
-        self, table: dict[str, int], assembly: Iterable[str], assembly_size: int
-    ) -> None:
-        cur_instruction: int = 0
-        counter: int = 0
-        reversed_assembly = reversed(list(assembly))
-        for rev_line in reversed_assembly:
-            if rev_line.find("//") != -1:
-                rev_line = rev_line[0 : rev_line.find("//")]
-            rev_line = rev_line.replace(" ", "")
-            if rev_line == "" or rev_line[0] == "/":
-                continue
-            if rev_line[0] != "(":
-                counter += 1
-                cur_instruction = assembly_size - counter
-            else:
-                table[rev_line[1 : rev_line.find(")")]] = cur_instruction
-
-    def build_variable_table(
-        self, table: dict[str, int], assembly: Iterable[str]
-    ) -> None:
-        cur_ind: int = 16
-        for line in assembly:
-            line = line.replace(" ", "")
-            if line.find("//") != -1:
-                line = line[0 : line.find("//")]
-            if line == "" or line[0] == "/":
-                continue
-            try:
-                int(line[1:])
-            except ValueError:
-                if line[0] == "@" and line[1:] not in table:
-                    table[line[1:]] = cur_ind
-                    cur_ind += 1
-
-    def handle_A_instruction(self, line: str, keyword_table: dict[str, int]) -> str:
-        res = "0"
-        try:
-            value: int = int(line[1:])
-            binary: str = bin(value).replace("0b", "")
-            res = "0" * (16 - len(binary)) + binary
-        except ValueError:
-            tmp = bin(keyword_table[line[1:]]).replace("0b", "")
-            res = "0" * (16 - len(tmp)) + tmp
-        return res
-
-    def handle_C_instruction(self, line: str, keyword_table: dict[str, int]) -> str:
-        res = "111"
-        if line.find("=") == -1:
-            res += self.comp_table[line[0 : line.find(";")]]
-            res += "000"
-            res += self.jump_table[line[line.find(";") + 1 :]]
-        elif line.find(";") == -1:
-            res += self.comp_table[line[line.find("=") + 1 :]]
-            res += self.dest_table["".join(sorted(line[0 : line.find("=")]))]
-            res += "000"
-        else:
-            res += self.comp_table[line[line.find("=") + 1 : line.find(";")]]
-            res += self.dest_table["".join(sorted(line[0 : line.find("=")]))]
-            res += self.jump_table[line[line.find(";") + 1 :]]
-        return res
+    def resolve(self, program: Program) -> dict[str, int]:
+        table: dict[str, int] = self.symbol_table.copy()
+        table.update(program.labels)
+        variable: int = 16
+        for symbol in program.references:
+            if symbol not in table:
+                table[symbol] = variable
+                variable += 1
+        return table
+
+    def handle_A_instruction(self, value: int) -> str:
+        return f"{value:016b}"
+
+    def handle_C_instruction(self, statement: Statement) -> str:
+        return (
+            "111"
+            + self.comp_table[statement.comp]
+            + (self.dest_table[statement.dest] if statement.dest else "000")
+            + (self.jump_table[statement.jump] if statement.jump else "000")
+        )
+
+    def encode(self, statement: Statement, table: dict[str, int]) -> str:
+        if statement.kind == Kind.COMMAND:
+            return self.handle_C_instruction(statement)
+        if statement.kind == Kind.SYMBOL:
+            return self.handle_A_instruction(table[statement.operand])
+        return self.handle_A_instruction(int(statement.operand))
 
     def assemble(self, assembly: Iterable[str]) -> Iterable[str]:
-        result: list[str] = []
-        assembly_size: int = self.get_assembly_size(assembly)
-        keywords: dict[str, int] = self.symbol_table.copy()
-        self.build_label_table(keywords, assembly, assembly_size)
-        self.build_variable_table(keywords, assembly)
-
-        for line in assembly:
-            if line.find("//") != -1:
-                line = line[0 : line.find("//")]
-            line = line.replace(" ", "")
-            if line == "":
-                continue
-            if line[0] == "@":
-                result.append(self.handle_A_instruction(line, keywords))
-            elif line[0] == "/":
-                continue
-            elif line.find("=") != -1 or line.find(";") != -1:
-                result.append(self.handle_C_instruction(line, keywords))
-
-        return result
+        program: Program = Program.parse(assembly)
+        if program.size > self.threshold:
+            return self.encode_parallel(program.statements, self.resolve(program))
+        return list(self.encode_all(program.statements, self.resolve(program)))
+
+    def encode_parallel(
+        self, program: list[Statement], table: dict[str, int]
+    ) -> list[str]:
+        workers: int = self.workers or os.cpu_count() or 1
+        size: int = max(-(-len(program) // (workers * CHUNKS_PER_WORKER)), 1)
+        chunks: list[list[Statement]] = [
+            program[start : start + size] for start in range(0, len(program), size)
+        ]
+        with ProcessPoolExecutor(workers) as pool:
+            return list(chain.from_iterable(pool.map(encode, chunks, repeat(table))))
+
+    def stream(self, assembly: Iterable[str]) -> Iterator[str]:
+        table: dict[str, int] = self.resolve(Program.parse(assembly, keep=False))
+        yield from self.encode_all(statements(assembly), table)
+
+    def encode_all(
+        self, program: Iterable[Statement], table: dict[str, int]
+    ) -> Iterator[str]:
+        encoded: dict[Statement, str] = {}
+        for statement in program:
+            yield encoded.get(statement) or encoded.setdefault(
+                statement, self.encode(statement, table)
+            )
+
+
+def encode(program: list[Statement], table: dict[str, int]) -> list[str]:
+    return list(Assembler().encode_all(program, table))
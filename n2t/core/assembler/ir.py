@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Iterable, Iterator, NamedTuple
+
+PARSE_CACHE = 4096
+
+
+class Kind(IntEnum):
+    LITERAL = 0
+    SYMBOL = 1
+    COMMAND = 2
+
+
+class Statement(NamedTuple):
+    kind: Kind
+    operand: str = ""
+    dest: str = ""
+    comp: str = ""
+    jump: str = ""
+
+
+def normalize(line: str) -> str:
+    comment: int = line.find("//")
+    if comment != -1:
+        line = line[:comment]
+    return line.replace(" ", "").strip()
+
+
+def address(operand: str) -> Statement:
+    try:
+        int(operand)
+    except ValueError:
+        return Statement(Kind.SYMBOL, operand)
+    return Statement(Kind.LITERAL, operand)
+
+
+def command(line: str) -> Statement:
+    dest, _, rest = line.partition("=") if "=" in line else ("", "", line)
+    comp, _, jump = rest.partition(";")
+    return Statement(Kind.COMMAND, dest="".join(sorted(dest)), comp=comp, jump=jump)
+
+
+def parse_statement(line: str) -> Statement | None:
+    if line[:1] == "@":
+        return address(line[1:])
+    if "=" in line or ";" in line:
+        return command(line)
+    return None
+
+
+def statements(
+    assembly: Iterable[str], labels: dict[str, int] | None = None
+) -> Iterator[Statement]:
+    parsed: dict[str, Statement] = {}
+    count: int = 0
+    for line in assembly:
+        statement: Statement | None = parsed.get(line)
+        if statement is None:
+            text: str = normalize(line)
+            if text[:1] == "(":
+                if labels is not None:
+                    labels.setdefault(text[1 : text.find(")")], count)
+                continue
+            statement = parse_statement(text)
+            if statement is None:
+                continue
+            if len(parsed) < PARSE_CACHE:
+                parsed[line] = statement
+        count += 1
+        yield statement
+
+
+@dataclass
+class Program:
+    statements: list[Statement] = field(default_factory=list)
+    labels: dict[str, int] = field(default_factory=dict)
+    references: dict[str, None] = field(default_factory=dict)
+    size: int = 0
+
+    @classmethod
+    def parse(cls, assembly: Iterable[str], keep: bool = True) -> Program:
+        program: Program = cls()
+        references: dict[str, None] = program.references
+        for statement in statements(assembly, program.labels):
+            program.size += 1
+            if statement.kind == Kind.SYMBOL:
+                references.setdefault(statement.operand)
+            if keep:
+                program.statements.append(statement)
+        return program
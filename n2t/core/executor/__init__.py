@@ -0,0 +1,11 @@
+from n2t.core.executor.blocks import BlockCompiler
+from n2t.core.executor.decoder import Instruction, decode, decode_words
+from n2t.core.executor.memory import Memory
+
+__all__ = [
+    "BlockCompiler",
+    "Instruction",
+    "Memory",
+    "decode",
+    "decode_words",
+]
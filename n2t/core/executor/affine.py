@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, NamedTuple
+
+from n2t.core.executor.decoder import (
+    ADDRESS_MASK,
+    DEST_A,
+    DEST_D,
+    DEST_M,
+    JEQ,
+    JGT,
+    JLT,
+    M_OPERAND,
+    SIGN_BIT,
+    Alu,
+    Instruction,
+)
+from n2t.core.executor.memory import KBD, RAM_SIZE
+
+TRACE_LIMIT = 512
+ATTEMPTS = 2
+MIN_SKIP = 256
+
+Symbol = int | str
+
+
+class Affine(NamedTuple):
+    constant: int
+    terms: tuple[tuple[Symbol, int], ...] = ()
+
+
+def affine(constant: int, terms: dict[Symbol, int]) -> Affine:
+    return Affine(
+        constant,
+        tuple(sorted(((s, c) for s, c in terms.items() if c), key=lambda t: str(t[0]))),
+    )
+
+
+def symbol(name: Symbol) -> Affine:
+    return Affine(0, ((name, 1),))
+
+
+def add(x: Affine, y: Affine, sign: int = 1) -> Affine:
+    terms: dict[Symbol, int] = dict(x.terms)
+    for name, coefficient in y.terms:
+        terms[name] = terms.get(name, 0) + sign * coefficient
+    return affine(x.constant + sign * y.constant, terms)
+
+
+def negate(x: Affine) -> Affine:
+    return affine(-x.constant, {name: -c for name, c in x.terms})
+
+
+ZX = 0b100000
+ZY = 0b001000
+
+ONE = Affine(1)
+
+AFFINE_ALU: dict[int, Callable[[Affine, Affine], Affine]] = {
+    0b101010: lambda d, y: Affine(0),
+    0b111111: lambda d, y: ONE,
+    0b111010: lambda d, y: Affine(-1),
+    0b001100: lambda d, y: d,
+    0b110000: lambda d, y: y,
+    0b001111: lambda d, y: negate(d),
+    0b110011: lambda d, y: negate(y),
+    0b011111: lambda d, y: add(d, ONE),
+    0b110111: lambda d, y: add(y, ONE),
+    0b001110: lambda d, y: add(d, ONE, -1),
+    0b110010: lambda d, y: add(y, ONE, -1),
+    0b000010: lambda d, y: add(d, y),
+    0b010011: lambda d, y: add(d, y, -1),
+    0b000111: lambda d, y: add(y, d, -1),
+}
+
+
+class NotAffine(Exception):
+    pass
+
+
+@dataclass
+class Trace:
+    program: list[Instruction]
+    ram: array[int]
+    values: dict[Symbol, int]
+    a: Affine = symbol("a")
+    d: Affine = symbol("d")
+    cells: dict[int, Affine] = field(default_factory=dict)
+    addresses: dict[int, Affine] = field(default_factory=dict)
+    outputs: list[Affine] = field(default_factory=list)
+    conditions: list[tuple[Affine, int, bool]] = field(default_factory=list)
+    length: int = 0
+    slopes: dict[Symbol, int] = field(default_factory=dict)
+    loads: set[int] = field(default_factory=set)
+
+    @classmethod
+    def record(
+        cls, program: list[Instruction], header: int, a: int, d: int, ram: array[int]
+    ) -> Trace:
+        trace: Trace = cls(program, ram, {"a": a, "d": d})
+        pc: int = header
+        while pc != header or not trace.length:
+            if pc >= len(program) or trace.length == TRACE_LIMIT:
+                raise NotAffine()
+            pc = trace.step(pc)
+            trace.length += 1
+        trace.classify()
+        return trace
+
+    def step(self, pc: int) -> int:
+        alu, value, dest, jump = self.program[pc]
+        if alu is None:
+            self.a = Affine(value)
+            return pc + 1
+        y: Affine = self.cells[self.load(self.a)] if value & M_OPERAND else self.a
+        out: Affine = self.compute(value & 0b111111, alu, self.d, y)
+        following: int = pc + 1
+        if jump:
+            current: int = self.evaluate(out)
+            taken: bool = bool(
+                jump & (JLT if current < 0 else JEQ if current == 0 else JGT)
+            )
+            if out.terms:
+                self.conditions.append((out, jump, taken))
+            if taken:
+                if self.a.terms:
+                    raise NotAffine()
+                following = self.a.constant & ADDRESS_MASK
+        if dest & DEST_M:
+            self.cells[self.key(self.a)] = out
+        if dest & DEST_D:
+            self.d = out
+        if dest & DEST_A:
+            self.a = out
+        return following
+
+    def compute(self, control: int, alu: Alu, d: Affine, y: Affine) -> Affine:
+        if not (d.terms and not control & ZX) and not (y.terms and not control & ZY):
+            return Affine(alu(d.constant, y.constant))
+        operation: Callable[[Affine, Affine], Affine] | None = AFFINE_ALU.get(control)
+        if operation is None:
+            raise NotAffine()
+        out: Affine = operation(d, y)
+        if not -SIGN_BIT <= self.evaluate(out) < SIGN_BIT:
+            raise NotAffine()
+        self.outputs.append(out)
+        return out
+
+    def key(self, address: Affine) -> int:
+        key: int = self.evaluate(address)
+        if not 0 <= key < RAM_SIZE or key == KBD:
+            raise NotAffine()
+        if self.addresses.setdefault(key, address) != address:
+            raise NotAffine()
+        return key
+
+    def load(self, address: Affine) -> int:
+        key: int = self.key(address)
+        if key not in self.cells:
+            self.values[key] = self.ram[key]
+            self.cells[key] = symbol(key)
+        return key
+
+    def classify(self) -> None:
+        used: set[Symbol] = {
+            name
+            for form in [*self.outputs, *self.addresses.values(), self.a, self.d]
+            for name, _ in form.terms
+        }
+        pending: list[Symbol] = [name for name in self.values if name in used]
+        while pending:
+            unresolved: list[Symbol] = []
+            for name in pending:
+                if isinstance(name, int):
+                    step: int | None = self.slope(self.addresses[name])
+                    if step is None:
+                        unresolved.append(name)
+                        continue
+                    if step:
+                        self.loads.add(name)
+                        continue
+                delta: Affine = add(self.final(name), symbol(name), -1)
+                if delta.terms:
+                    raise NotAffine()
+                self.slopes[name] = delta.constant
+            if len(unresolved) == len(pending):
+                raise NotAffine()
+            pending = unresolved
+        for form in [*self.addresses.values(), *(c[0] for c in self.conditions)]:
+            if self.slope(form) is None:
+                raise NotAffine()
+
+    def final(self, name: Symbol) -> Affine:
+        if name == "a":
+            return self.a
+        if name == "d":
+            return self.d
+        assert isinstance(name, int)
+        return self.cells[name]
+
+    def slope(self, form: Affine) -> int | None:
+        total: int = 0
+        for name, coefficient in form.terms:
+            if name not in self.slopes:
+                return None
+            total += coefficient * self.slopes[name]
+        return total
+
+    def evaluate(self, form: Affine, k: int = 0) -> int:
+        return form.constant + sum(
+            coefficient * self.value_of(name, k) for name, coefficient in form.terms
+        )
+
+    def value_of(self, name: Symbol, k: int) -> int:
+        if name in self.loads:
+            assert isinstance(name, int)
+            return self.ram[self.evaluate(self.addresses[name], k)]
+        return self.values[name] + self.slopes.get(name, 0) * k
+
+    def iterations(self, budget: int) -> int:
+        bounds: list[int] = [budget // self.length] if budget >= 0 else []
+        for form in self.outputs:
+            step: int | None = self.slope(form)
+            if step is None:
+                if form != symbol(form.terms[0][0]):
+                    raise NotAffine()
+                continue
+            bounds.append(
+                first_outside(self.evaluate(form), step, -SIGN_BIT, SIGN_BIT - 1)
+            )
+        for form, jump, taken in self.conditions:
+            bounds.append(
+                first_failure(self.evaluate(form), self.slope(form) or 0, jump, taken)
+            )
+        for address in self.addresses.values():
+            start: int = self.evaluate(address)
+            step = self.slope(address) or 0
+            if start < KBD:
+                bounds.append(first_outside(start, step, 0, KBD - 1))
+            else:
+                bounds.append(first_outside(start, step, KBD + 1, RAM_SIZE - 1))
+        finite: list[int] = [bound for bound in bounds if bound >= 0]
+        if not finite:
+            raise NotAffine()
+        return min(finite)
+
+    def spans(self, iterations: int) -> tuple[set[int], list[range]]:
+        fixed: set[int] = set()
+        varying: list[range] = []
+        for key, address in self.addresses.items():
+            step: int = self.slope(address) or 0
+            if not step:
+                fixed.add(key)
+                continue
+            last: int = self.evaluate(address, iterations - 1)
+            varying.append(range(min(key, last), max(key, last) + 1))
+        return fixed, varying
+
+    def fast_forward(self, budget: int) -> tuple[int, int, int]:
+        iterations: int = self.iterations(budget)
+        if iterations < 2:
+            return self.values["a"], self.values["d"], 0
+        fixed, varying = self.spans(iterations)
+        varying.sort(key=lambda region: region.start)
+        for first, second in zip(varying, varying[1:]):
+            if first.stop > second.start:
+                raise NotAffine()
+        if any(key in region for region in varying for key in fixed):
+            raise NotAffine()
+        last: int = iterations - 1
+        words: list[tuple[int, int]] = []
+        blocks: list[tuple[slice, array[int]]] = []
+        for key, value in self.cells.items():
+            if value == symbol(key):
+                continue
+            step: int = self.slope(self.addresses[key]) or 0
+            if not step:
+                words.append((key, self.evaluate(value, last)))
+            elif self.slope(value) == 0:
+                blocks.append(
+                    (
+                        span(key, step, iterations),
+                        array("h", [self.evaluate(value)]) * iterations,
+                    )
+                )
+            else:
+                values = (self.evaluate(value, k) for k in range(iterations))
+                blocks.append((span(key, step, iterations), array("h", values)))
+        a: int = self.evaluate(self.a, last)
+        d: int = self.evaluate(self.d, last)
+        for key, word in words:
+            self.ram[key] = word
+        for target, block in blocks:
+            self.ram[target] = block
+        return a, d, iterations * self.length
+
+
+def span(start: int, step: int, count: int) -> slice:
+    stop: int = start + step * count
+    return slice(start, stop if stop >= 0 else None, step)
+
+
+def first_outside(start: int, step: int, low: int, high: int) -> int:
+    if step > 0:
+        return (high - start) // step + 1
+    if step < 0:
+        return (start - low) // -step + 1
+    return -1
+
+
+def first_failure(start: int, step: int, jump: int, taken: bool) -> int:
+    if not step:
+        return -1
+    candidates: list[int] = [first_outside(start, step, 0, 0)]
+    if -start % step == 0:
+        candidates.append(-start // step)
+    for k in sorted(candidate for candidate in candidates if candidate > 0):
+        value: int = start + step * k
+        if bool(jump & (JLT if value < 0 else JEQ if value == 0 else JGT)) != taken:
+            return k
+    return -1
+
+
+def skip_iterations(
+    program: list[Instruction],
+    header: int,
+    a: int,
+    d: int,
+    ram: array[int],
+    budget: int,
+) -> tuple[int, int, int] | None:
+    try:
+        return Trace.record(program, header, a, d, ram).fast_forward(budget)
+    except NotAffine:
+        return None
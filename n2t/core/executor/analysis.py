@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from n2t.core.executor.decoder import Instruction
+from n2t.core.executor.idioms import (
+    Macro,
+    find_macros,
+    macro_indices,
+    restore_macros,
+)
+from n2t.core.executor.loops import (
+    BACK,
+    LOOP,
+    Loop,
+    find_back_edges,
+    find_loops,
+    mark,
+)
+
+
+@dataclass(frozen=True)
+class Analysis:
+    program: list[Instruction]
+    loops: dict[int, Loop]
+    backs: tuple[int, ...]
+    macros: list[Macro | None]
+
+    @classmethod
+    def of(cls, program: list[Instruction]) -> Analysis:
+        loops: dict[int, Loop] = find_loops(program)
+        looped: list[Instruction] = mark(program, loops, LOOP)
+        backs: tuple[int, ...] = tuple(find_back_edges(looped))
+        marked: list[Instruction] = mark(looped, backs, BACK)
+        return cls(marked, loops, backs, find_macros(marked))
+
+    @classmethod
+    def restore(
+        cls,
+        program: list[Instruction],
+        loops: dict[int, Loop],
+        backs: tuple[int, ...],
+        indices: dict[int, int],
+    ) -> Analysis:
+        marked: list[Instruction] = mark(mark(program, loops, LOOP), backs, BACK)
+        return cls(marked, loops, backs, restore_macros(len(marked), indices))
+
+    @property
+    def indices(self) -> dict[int, int]:
+        return macro_indices(self.macros)
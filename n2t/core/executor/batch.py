@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from n2t.core.executor.decoder import (
+    ADDRESS_MASK,
+    DEST_A,
+    DEST_D,
+    DEST_M,
+    JEQ,
+    JGT,
+    JLT,
+    M_OPERAND,
+    Instruction,
+    to_word,
+)
+from n2t.core.executor.loops import LOOP, Loop, find_loops, mark_loops
+from n2t.core.executor.memory import RAM_SIZE
+
+Registers = NDArray[np.int32]
+NEVER = np.iinfo(np.int64).min
+
+
+@dataclass
+class BatchExecutor:
+    program: list[Instruction]
+    RAM: NDArray[np.int16]
+    A: Registers
+    D: Registers
+    PC: Registers
+    halted: NDArray[np.bool_]
+    loops: dict[int, Loop] = field(default_factory=dict)
+    loop_states: dict[int, tuple[NDArray[np.int64], NDArray[np.int32]]] = field(
+        default_factory=dict
+    )
+    cycle: int = 0
+
+    @classmethod
+    def create(
+        cls, program: list[Instruction], initial: Sequence[Mapping[int, int]]
+    ) -> BatchExecutor:
+        ram: NDArray[np.int16] = np.zeros((len(initial), RAM_SIZE), dtype=np.int16)
+        for row, values in enumerate(initial):
+            for address, value in values.items():
+                ram[row, address] = to_word(value)
+        registers: Registers = np.zeros(len(initial), dtype=np.int32)
+        loops: dict[int, Loop] = find_loops(program)
+        return cls(
+            mark_loops(program, loops),
+            ram,
+            registers,
+            registers.copy(),
+            registers.copy(),
+            np.zeros(len(initial), dtype=np.bool_),
+            loops,
+        )
+
+    def run(self, cycles: int) -> None:
+        tick: int = cycles
+        inf: bool = tick < 0
+        while (inf or tick > 0) and self.step():
+            tick -= 1
+
+    def step(self) -> bool:
+        active: NDArray[np.intp] = np.flatnonzero(
+            (self.PC < len(self.program)) & ~self.halted
+        )
+        if active.size == 0:
+            return False
+        pcs: Registers = self.PC[active]
+        if (pcs == pcs[0]).all():
+            self.execute(int(pcs[0]), active)
+        else:
+            unique, inverse = np.unique(pcs, return_inverse=True)
+            for group, pc in enumerate(unique):
+                self.execute(int(pc), active[inverse == group])
+        self.cycle += 1
+        return True
+
+    def execute(self, pc: int, rows: NDArray[np.intp]) -> None:
+        instruction_alu, value, dest, jump = self.program[pc]
+        if instruction_alu is None:
+            self.A[rows] = value
+            self.PC[rows] = pc + 1
+            return
+        alu: Callable[[Any, Any], Any] = instruction_alu
+        a: Registers = self.A[rows]
+        address: Registers = a & ADDRESS_MASK
+        y: Registers = (
+            self.RAM[rows, address].astype(np.int32) if value & M_OPERAND else a
+        )
+        out: Any = np.broadcast_to(np.int32(0) + alu(self.D[rows], y), rows.shape)
+        if jump:
+            taken = (
+                (out < 0) & bool(jump & JLT)
+                | (out == 0) & bool(jump & JEQ)
+                | (out > 0) & bool(jump & JGT)
+            )
+            self.PC[rows] = np.where(taken, address, pc + 1)
+            if jump & LOOP:
+                self.settle(pc, rows[taken])
+        else:
+            self.PC[rows] = pc + 1
+        if dest & DEST_M:
+            self.RAM[rows, address] = out
+        if dest & DEST_D:
+            self.D[rows] = out
+        if dest & DEST_A:
+            self.A[rows] = out
+
+    def settle(self, end: int, rows: NDArray[np.intp]) -> None:
+        loop: Loop = self.loops[end]
+        cycles, states = self.loop_states.setdefault(
+            end,
+            (
+                np.full(len(self.PC), NEVER, dtype=np.int64),
+                np.zeros((len(self.PC), len(loop.addresses) + 1), dtype=np.int32),
+            ),
+        )
+        state: NDArray[np.int32] = np.column_stack(
+            [self.D[rows], self.RAM[rows[:, None], np.array(loop.addresses, int)]]
+        ).astype(np.int32)
+        settled: NDArray[np.bool_] = (cycles[rows] == self.cycle - loop.length) & (
+            states[rows] == state
+        ).all(axis=1)
+        cycles[rows] = self.cycle
+        states[rows] = state
+        self.halted[rows[settled]] = True
+
+    def dump(self, ranges: Iterable[range] | None = None) -> list[dict[int, int]]:
+        spans: list[range] = list(ranges or [range(RAM_SIZE)])
+        result: list[dict[int, int]] = []
+        for row in self.RAM:
+            dump: dict[int, int] = {}
+            for span in spans:
+                window: NDArray[np.int16] = row[span.start : span.stop]
+                for offset in np.flatnonzero(window):
+                    dump[span.start + int(offset)] = int(window[offset])
+            result.append(dump)
+        return result
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, NamedTuple
+
+from n2t.core.executor.decoder import (
+    ADDRESS_MASK,
+    ALU,
+    DEST_A,
+    DEST_D,
+    DEST_M,
+    M_OPERAND,
+    Alu,
+    Instruction,
+    generic_alu,
+)
+from n2t.core.executor.loops import BACK, LOOP, jump_target
+
+BlockFunction = Callable[[int, int, "array[int]"], tuple[int, int, int]]
+
+
+def wrapped(expression: str) -> str:
+    return f"(({expression} + 32768) & 65535) - 32768"
+
+
+COMP_EXPRESSIONS: dict[int, str] = {
+    0b101010: "0",
+    0b111111: "1",
+    0b111010: "-1",
+    0b001100: "d",
+    0b110000: "{y}",
+    0b001101: "~d",
+    0b110001: "~{y}",
+    0b001111: wrapped("-d"),
+    0b110011: wrapped("-{y}"),
+    0b011111: wrapped("d + 1"),
+    0b110111: wrapped("{y} + 1"),
+    0b001110: wrapped("d - 1"),
+    0b110010: wrapped("{y} - 1"),
+    0b000010: wrapped("d + {y}"),
+    0b010011: wrapped("d - {y}"),
+    0b000111: wrapped("{y} - d"),
+    0b000000: "d & {y}",
+    0b010101: "d | {y}",
+}
+
+JUMP_CONDITIONS: dict[int, str] = {
+    0b001: "out > 0",
+    0b010: "out == 0",
+    0b011: "out >= 0",
+    0b100: "out < 0",
+    0b101: "out != 0",
+    0b110: "out <= 0",
+}
+
+UNCONDITIONAL = 0b111
+
+
+GENERIC_ALUS: dict[int, Alu] = {
+    control: generic_alu(control) for control in range(64) if control not in ALU
+}
+
+
+class Block(NamedTuple):
+    run: BlockFunction
+    length: int
+    loop: int = -1
+    back: int = -1
+
+
+@dataclass
+class BlockCompiler:
+    program: list[Instruction]
+    cache: dict[int, Block] = field(default_factory=dict)
+
+    def block_at(self, start: int) -> Block:
+        block: Block | None = self.cache.get(start)
+        if block is None:
+            block = self.cache[start] = self.compile_block(start)
+        return block
+
+    def compile_block(self, start: int) -> Block:
+        namespace: dict[str, Any] = block_namespace()
+        source, length = self.block_source(start, "block")
+        exec(compile(source, f"<block {start}>", "exec"), namespace)
+        return Block(
+            namespace["block"],
+            length,
+            self.loop_of(start, length),
+            self.back_of(start, length),
+        )
+
+    def module_source(self, starts: Iterable[int]) -> str:
+        lines: list[str] = []
+        entries: list[str] = []
+        for start in sorted(starts):
+            source, length = self.block_source(start, f"block_{start}")
+            loop: int = self.loop_of(start, length)
+            back: int = self.back_of(start, length)
+            lines.append(source)
+            entries.append(f"    {start}: (block_{start}, {length}, {loop}, {back}),")
+        return "\n".join([*lines, "BLOCKS = {", *entries, "}", ""])
+
+    def block_source(self, start: int, name: str) -> tuple[str, int]:
+        lines: list[str] = [f"def {name}(a, d, ram):"]
+        a: str = "a"
+        pc: int = start
+        while pc < len(self.program):
+            instruction: Instruction = self.program[pc]
+            pc += 1
+            if instruction.alu is None:
+                a = str(instruction.value)
+                continue
+            y: str = f"ram[{a}]" if instruction.value & M_OPERAND else a
+            expression: str = self.expression(instruction, y)
+            if instruction.jump:
+                lines.extend(self.exit(instruction, expression, a, pc))
+                return "\n    ".join(lines) + "\n", pc - start
+            if instruction.dest:
+                lines.append(f"{store(instruction.dest, a)} = {expression}")
+            if instruction.dest & DEST_A:
+                a = "a"
+        lines.append(f"return {pc}, {a}, d")
+        return "\n    ".join(lines) + "\n", pc - start
+
+    def loop_of(self, start: int, length: int) -> int:
+        end: int = start + length - 1
+        return end if length and self.program[end].jump & LOOP else -1
+
+    def back_of(self, start: int, length: int) -> int:
+        end: int = start + length - 1
+        if not length or not self.program[end].jump & BACK:
+            return -1
+        target: int | None = jump_target(self.program, end)
+        return -1 if target is None else target
+
+    @staticmethod
+    def expression(instruction: Instruction, y: str) -> str:
+        control: int = instruction.value & 0b111111
+        template: str = COMP_EXPRESSIONS.get(control, f"alus[{control}](d, {{y}})")
+        return template.format(y=y)
+
+    @staticmethod
+    def exit(
+        instruction: Instruction, expression: str, a: str, pc: int | str
+    ) -> list[str]:
+        jump: int = instruction.jump & ~(LOOP | BACK)
+        lines: list[str] = []
+        target: str = a if a != "a" else f"a & {ADDRESS_MASK}"
+        if a == "a" and instruction.dest & DEST_A:
+            lines.append(f"target = a & {ADDRESS_MASK}")
+            target = "target"
+        if instruction.dest:
+            lines.append(f"out = {store(instruction.dest, a)} = {expression}")
+        elif jump != UNCONDITIONAL:
+            lines.append(f"out = {expression}")
+        after: str = "a" if instruction.dest & DEST_A else a
+        if jump == UNCONDITIONAL:
+            return [*lines, f"return {target}, {after}, d"]
+        condition: str = JUMP_CONDITIONS[jump]
+        return [
+            *lines,
+            f"if {condition}:",
+            f"    return {target}, {after}, d",
+            f"return {pc}, {after}, d",
+        ]
+
+
+def store(dest: int, a: str) -> str:
+    targets: list[str] = []
+    if dest & DEST_M:
+        targets.append(f"ram[{a}]")
+    if dest & DEST_D:
+        targets.append("d")
+    if dest & DEST_A:
+        targets.append("a")
+    return " = ".join(targets)
+
+
+def block_namespace() -> dict[str, Any]:
+    return {"alus": GENERIC_ALUS}
+
+
+def find_leaders(program: list[Instruction]) -> frozenset[int]:
+    leaders: set[int] = {0}
+    for pc, instruction in enumerate(program):
+        if instruction.alu is not None:
+            if instruction.jump:
+                leaders.add(pc + 1)
+            continue
+        following: Instruction | None = (
+            program[pc + 1] if pc + 1 < len(program) else None
+        )
+        if (
+            following is not None
+            and following.alu is not None
+            and (following.jump or not following.value & M_OPERAND)
+        ):
+            leaders.add(instruction.value)
+    return frozenset(leader for leader in leaders if leader < len(program))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, NamedTuple
+
+Alu = Callable[[int, int], int]
+
+M_OPERAND = 0b1000000
+
+DEST_A = 0b100
+DEST_D = 0b010
+DEST_M = 0b001
+
+JLT = 0b100
+JEQ = 0b010
+JGT = 0b001
+
+WORD_MASK = 0xFFFF
+ADDRESS_MASK = 0x7FFF
+SIGN_BIT = 0x8000
+ROM_SIZE = 0x8000
+
+
+def to_word(value: int) -> int:
+    return ((value + SIGN_BIT) & WORD_MASK) - SIGN_BIT
+
+
+ALU: dict[int, Alu] = {
+    0b101010: lambda d, y: 0,
+    0b111111: lambda d, y: 1,
+    0b111010: lambda d, y: -1,
+    0b001100: lambda d, y: d,
+    0b110000: lambda d, y: y,
+    0b001101: lambda d, y: ~d,
+    0b110001: lambda d, y: ~y,
+    0b001111: lambda d, y: ((-d + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b110011: lambda d, y: ((-y + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b011111: lambda d, y: ((d + 1 + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b110111: lambda d, y: ((y + 1 + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b001110: lambda d, y: ((d - 1 + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b110010: lambda d, y: ((y - 1 + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b000010: lambda d, y: ((d + y + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b010011: lambda d, y: ((d - y + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b000111: lambda d, y: ((y - d + SIGN_BIT) & WORD_MASK) - SIGN_BIT,
+    0b000000: lambda d, y: d & y,
+    0b010101: lambda d, y: d | y,
+}
+
+
+class Instruction(NamedTuple):
+    alu: Alu | None
+    value: int
+    dest: int = 0
+    jump: int = 0
+
+
+class Halt(Exception):
+    pass
+
+
+def halt(d: int, y: int) -> int:
+    raise Halt()
+
+
+HALT = Instruction(halt, 0)
+
+
+def pad(program: list[Instruction]) -> list[Instruction]:
+    return program + [HALT] * max(ROM_SIZE + 1 - len(program), 1)
+
+
+def decode(words: Iterable[str]) -> list[Instruction]:
+    decoded: dict[str, Instruction] = {}
+    return [
+        decoded.get(word) or decoded.setdefault(word, decode_one(word))
+        for word in words
+    ]
+
+
+def decode_words(words: Iterable[int]) -> list[Instruction]:
+    decoded: dict[int, Instruction] = {}
+    return [
+        decoded.get(word) or decoded.setdefault(word, decode_bits(word))
+        for word in words
+    ]
+
+
+def decode_one(word: str) -> Instruction:
+    return decode_bits(int(word, 2))
+
+
+def decode_bits(bits: int) -> Instruction:
+    if not bits >> 15:
+        return Instruction(None, bits)
+    comp: int = (bits >> 6) & 0b1111111
+    control: int = comp & 0b111111
+    alu: Alu = ALU.get(control) or generic_alu(control)
+    return Instruction(alu, comp, (bits >> 3) & 0b111, bits & 0b111)
+
+
+def generic_alu(control: int) -> Alu:
+    zx, nx, zy, ny, f, no = (bool(control >> shift & 1) for shift in range(5, -1, -1))
+
+    def alu(d: int, y: int) -> int:
+        x: int = 0 if zx else d
+        x = ~x if nx else x
+        y = 0 if zy else y
+        y = ~y if ny else y
+        out: int = to_word(x + y) if f else x & y
+        return ~out if no else out
+
+    return alu
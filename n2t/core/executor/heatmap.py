@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from n2t.core.executor.memory import KBD, RAM_SIZE, SCREEN
+
+STATICS = 16
+STACK = 256
+HEAP = 2048
+
+
+class Region(NamedTuple):
+    name: str
+    start: int
+    stop: int
+
+
+REGIONS: tuple[Region, ...] = (
+    Region("registers", 0, STATICS),
+    Region("statics", STATICS, STACK),
+    Region("stack", STACK, HEAP),
+    Region("heap", HEAP, SCREEN),
+    Region("screen", SCREEN, KBD),
+    Region("keyboard", KBD, KBD + 1),
+    Region("unmapped", KBD + 1, RAM_SIZE),
+)
+
+
+class RegionUsage(NamedTuple):
+    region: Region
+    reads: int
+    writes: int
+    touched: int
+    highest: int
+
+
+@dataclass
+class Heatmap:
+    reads: list[int]
+    writes: list[int]
+    max_sp: int = 0
+
+    @classmethod
+    def create(cls) -> Heatmap:
+        return cls([0] * RAM_SIZE, [0] * RAM_SIZE)
+
+    def usage(self, region: Region) -> RegionUsage:
+        reads: list[int] = self.reads[region.start : region.stop]
+        writes: list[int] = self.writes[region.start : region.stop]
+        touched: list[int] = [
+            region.start + offset
+            for offset, (read, written) in enumerate(zip(reads, writes))
+            if read or written
+        ]
+        return RegionUsage(
+            region, sum(reads), sum(writes), len(touched), max(touched, default=-1)
+        )
+
+    @property
+    def heap_top(self) -> int:
+        return self.usage(REGIONS[3]).highest
+
+    def hottest(self, limit: int) -> list[int]:
+        return sorted(
+            (address for address in range(RAM_SIZE) if self.accesses(address)),
+            key=lambda address: -self.accesses(address),
+        )[:limit]
+
+    def accesses(self, address: int) -> int:
+        return self.reads[address] + self.writes[address]
+
+
+def region_of(address: int) -> str:
+    return next(
+        region.name for region in REGIONS if region.start <= address < region.stop
+    )
+
+
+def render_heatmap(heatmap: Heatmap, limit: int = 20) -> list[str]:
+    report: list[str] = ["RAM regions"]
+    report.append(
+        f"{'region':<10} {'range':>12} {'reads':>12} {'writes':>12} "
+        f"{'touched':>8} {'highest':>8}"
+    )
+    for region in REGIONS:
+        usage: RegionUsage = heatmap.usage(region)
+        report.append(
+            f"{region.name:<10} {f'{region.start}-{region.stop - 1}':>12} "
+            f"{usage.reads:>12} {usage.writes:>12} {usage.touched:>8} "
+            f"{usage.highest:>8}"
+        )
+    report.append("")
+    report.append(
+        f"Max SP {heatmap.max_sp} "
+        f"({max(heatmap.max_sp - STACK, 0)} of {HEAP - STACK} stack words)"
+    )
+    report.append(
+        f"Heap high-water mark {heatmap.heap_top} "
+        f"({max(heatmap.heap_top - HEAP + 1, 0)} of {SCREEN - HEAP} heap words)"
+    )
+    report.append("")
+    report.append("Hottest addresses")
+    report.append(f"{'address':>8} {'region':<10} {'reads':>12} {'writes':>12}")
+    for address in heatmap.hottest(limit):
+        report.append(
+            f"{address:>8} {region_of(address):<10} "
+            f"{heatmap.reads[address]:>12} {heatmap.writes[address]:>12}"
+        )
+    return report
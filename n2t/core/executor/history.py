@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+
+from n2t.core.executor.snapshot import Snapshot
+
+NO_WRITE = -1
+ENTRY_BYTES = 12
+
+Entry = tuple[int, int, int, int, int]
+
+
+def column(typecode: str, capacity: int) -> array[int]:
+    return array(typecode, [0]) * capacity
+
+
+@dataclass
+class History:
+    interval: int
+    budget: int
+    pcs: array[int]
+    a: array[int]
+    d: array[int]
+    addresses: array[int]
+    old: array[int]
+    head: int = 0
+    size: int = 0
+    snapshots: deque[tuple[int, bytes]] = field(default_factory=deque)
+    snapshot_bytes: int = 0
+    next_snapshot: int = 0
+
+    @classmethod
+    def create(cls, interval: int, budget: int) -> History:
+        if interval <= 0:
+            raise ValueError("Snapshot interval must be positive")
+        capacity: int = max(budget // 2 // ENTRY_BYTES, 1)
+        return cls(
+            interval,
+            budget,
+            column("H", capacity),
+            column("h", capacity),
+            column("h", capacity),
+            column("i", capacity),
+            column("h", capacity),
+        )
+
+    @property
+    def capacity(self) -> int:
+        return len(self.pcs)
+
+    def push(self, pc: int, a: int, d: int, address: int, old: int) -> None:
+        index: int = self.head
+        self.pcs[index] = pc
+        self.a[index] = a
+        self.d[index] = d
+        self.addresses[index] = address
+        self.old[index] = old
+        self.head = (index + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def pop(self) -> Entry:
+        assert self.size, "Write log is empty"
+        self.size -= 1
+        self.head = index = (self.head - 1) % self.capacity
+        return (
+            self.pcs[index],
+            self.a[index],
+            self.d[index],
+            self.addresses[index],
+            self.old[index],
+        )
+
+    def drop(self, count: int) -> None:
+        count = min(count, self.size)
+        self.size -= count
+        self.head = (self.head - count) % self.capacity
+
+    def clear(self) -> None:
+        self.size = 0
+
+    def keep(self, snapshot: Snapshot) -> None:
+        self.next_snapshot = snapshot.cycle + self.interval
+        if self.snapshots and self.snapshots[-1][0] >= snapshot.cycle:
+            return
+        data: bytes = snapshot.to_bytes()
+        self.snapshots.append((snapshot.cycle, data))
+        self.snapshot_bytes += len(data)
+        while self.snapshot_bytes > self.budget // 2 and len(self.snapshots) > 1:
+            self.snapshot_bytes -= len(self.snapshots.popleft()[1])
+
+    def before(self, cycle: int) -> Snapshot:
+        kept: list[tuple[int, bytes]] = [s for s in self.snapshots if s[0] <= cycle]
+        if not kept:
+            raise ValueError(f"Cycle {cycle} is no longer in history")
+        return Snapshot.from_bytes(kept[-1][1])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Iterable, NamedTuple
+
+from n2t.core.executor.decoder import SIGN_BIT, to_word
+
+SP = 0
+LCL = 1
+ARG = 2
+THIS = 3
+THAT = 4
+
+RoutineFunction = Callable[["array[int]", list[int]], "int | None"]
+
+
+class Routine(NamedTuple):
+    name: str
+    arity: int
+    run: RoutineFunction
+    cycles: int
+
+
+def multiply(ram: array[int], args: list[int]) -> int | None:
+    return to_word(args[0] * args[1])
+
+
+def divide(ram: array[int], args: list[int]) -> int | None:
+    x, y = args
+    if y == 0 or -SIGN_BIT in (x, y):
+        return None
+    quotient: int = abs(x) // abs(y)
+    return quotient if (x < 0) == (y < 0) else -quotient
+
+
+def absolute(ram: array[int], args: list[int]) -> int | None:
+    return to_word(abs(args[0]))
+
+
+def peek(ram: array[int], args: list[int]) -> int | None:
+    return ram[args[0]]
+
+
+OS_ROUTINES: dict[str, Routine] = {
+    routine.name.lower(): routine
+    for routine in [
+        Routine("Math.multiply", 2, multiply, 1460),
+        Routine("Math.divide", 2, divide, 3310),
+        Routine("Math.abs", 1, absolute, 85),
+        Routine("Memory.peek", 1, peek, 73),
+    ]
+}
+
+
+def find_routines(
+    labels: Iterable[tuple[int, str]],
+    routines: dict[str, Routine] = OS_ROUTINES,
+) -> dict[int, Routine]:
+    return {
+        address: routines[label.lower()]
+        for address, label in labels
+        if label.lower() in routines
+    }
+
+
+def call(routine: Routine, ram: array[int]) -> tuple[int, int] | None:
+    frame: int = ram[LCL]
+    arg: int = ram[ARG]
+    result: int | None = routine.run(ram, [ram[arg + i] for i in range(routine.arity)])
+    if result is None:
+        return None
+    ram[arg] = result
+    ram[SP] = arg + 1
+    ram[THAT] = ram[frame - 1]
+    ram[THIS] = ram[frame - 2]
+    ram[ARG] = ram[frame - 3]
+    ram[LCL] = ram[frame - 4]
+    return ram[frame - 5], ram[LCL]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from array import array
+from functools import cache
+from typing import Any, Callable, NamedTuple, Sequence
+
+from n2t.core.assembler import Assembler
+from n2t.core.executor.blocks import BlockCompiler, block_namespace, store
+from n2t.core.executor.decoder import M_OPERAND, Instruction, decode
+
+MacroFunction = Callable[[int, int, int, "array[int]"], tuple[int, int, int]]
+
+IDIOMS: tuple[tuple[str, ...], ...] = (
+    ("AM=M+1", "A=A-1", "M=D"),
+    ("AM=M+1", "A=A-1", "M=0"),
+    ("M=M+1", "A=M-1", "M=D"),
+    ("M=M+1", "A=M-1", "M=0"),
+    ("M=M+1", "A=M-1", "M=1"),
+    ("AM=M-1", "D=M"),
+    ("AM=M-1", "D=M", "A=A-1", "M=D+M"),
+    ("AM=M-1", "D=M", "A=A-1", "M=M-D"),
+    ("AM=M-1", "D=M", "A=A-1", "M=D&M"),
+    ("AM=M-1", "D=M", "A=A-1", "M=D|M"),
+    ("M=M-1", "A=M", "D=M"),
+    ("M=M-1", "A=M"),
+    ("A=M-1", "M=!M"),
+    ("A=M-1", "M=-M"),
+    ("A=M-1", "M=-1"),
+    ("A=M", "D=M"),
+    ("A=M", "M=D"),
+    ("A=M+1", "D=M"),
+    ("A=M+1", "M=D"),
+    ("A=M+1", "A=A+1", "D=M"),
+    ("A=M+1", "A=A+1", "M=D"),
+    ("A=D+A", "D=M"),
+    ("A=M", "0;JMP"),
+    ("D=A",),
+    ("D=M",),
+    ("M=D",),
+    ("D=D+A",),
+    ("0;JMP",),
+    ("D;JGT",),
+    ("D;JEQ",),
+    ("D;JGE",),
+    ("D;JLT",),
+    ("D;JNE",),
+    ("D;JLE",),
+)
+
+
+class Macro(NamedTuple):
+    run: MacroFunction
+    length: int
+
+
+def macro_source(body: Sequence[Instruction], name: str) -> str:
+    lines: list[str] = [f"def {name}(pc, a, d, ram):"]
+    for offset, instruction in enumerate(body, 2):
+        y: str = "ram[a]" if instruction.value & M_OPERAND else "a"
+        expression: str = BlockCompiler.expression(instruction, y)
+        if instruction.jump:
+            lines.extend(
+                BlockCompiler.exit(instruction, expression, "a", f"pc + {offset}")
+            )
+            return "\n    ".join(lines) + "\n"
+        lines.append(f"{store(instruction.dest, 'a')} = {expression}")
+    lines.append(f"return pc + {len(body) + 1}, a, d")
+    return "\n    ".join(lines) + "\n"
+
+
+def compile_macro(body: Sequence[Instruction]) -> Macro:
+    namespace: dict[str, Any] = block_namespace()
+    exec(compile(macro_source(body, "macro"), "<macro>", "exec"), namespace)
+    return Macro(namespace["macro"], len(body) + 1)
+
+
+@cache
+def compile_idioms() -> dict[tuple[Instruction, ...], Macro]:
+    assembler: Assembler = Assembler.create()
+    macros: dict[tuple[Instruction, ...], Macro] = {}
+    for idiom in IDIOMS:
+        body: tuple[Instruction, ...] = tuple(decode(assembler.assemble(idiom)))
+        macros[body] = compile_macro(body)
+    return macros
+
+
+@cache
+def idiom_lengths() -> dict[Instruction, list[int]]:
+    lengths: dict[Instruction, set[int]] = {}
+    for body in compile_idioms():
+        lengths.setdefault(body[0], set()).add(len(body))
+    return {first: sorted(sizes, reverse=True) for first, sizes in lengths.items()}
+
+
+def find_macros(program: list[Instruction]) -> list[Macro | None]:
+    idioms: dict[tuple[Instruction, ...], Macro] = compile_idioms()
+    starts: dict[Instruction, list[int]] = idiom_lengths()
+    macros: list[Macro | None] = [None] * len(program)
+    for pc in range(len(program) - 1):
+        if program[pc].alu is not None:
+            continue
+        for length in starts.get(program[pc + 1], ()):
+            macro: Macro | None = idioms.get(tuple(program[pc + 1 : pc + 1 + length]))
+            if macro is not None:
+                macros[pc] = macro
+                break
+    return macros
+
+
+@cache
+def idiom_macros() -> tuple[Macro, ...]:
+    return tuple(compile_idioms().values())
+
+
+def macro_indices(macros: list[Macro | None]) -> dict[int, int]:
+    index: dict[Macro, int] = {
+        macro: number for number, macro in enumerate(idiom_macros())
+    }
+    return {pc: index[macro] for pc, macro in enumerate(macros) if macro is not None}
+
+
+def restore_macros(size: int, indices: dict[int, int]) -> list[Macro | None]:
+    table: tuple[Macro, ...] = idiom_macros()
+    macros: list[Macro | None] = [None] * size
+    for pc, number in indices.items():
+        macros[pc] = table[number]
+    return macros
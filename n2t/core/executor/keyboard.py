@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+RELEASE = 0
+
+KEYS: dict[str, int] = {
+    "release": RELEASE,
+    "-": RELEASE,
+    "space": 32,
+    "newline": 128,
+    "backspace": 129,
+    "left": 130,
+    "up": 131,
+    "right": 132,
+    "down": 133,
+    "home": 134,
+    "end": 135,
+    "pageup": 136,
+    "pagedown": 137,
+    "insert": 138,
+    "delete": 139,
+    "esc": 140,
+    **{f"f{number}": 140 + number for number in range(1, 13)},
+}
+
+
+class KeyEvent(NamedTuple):
+    cycle: int
+    key: int
+
+
+def key_code(text: str) -> int:
+    if text.lower() in KEYS:
+        return KEYS[text.lower()]
+    if len(text) == 1:
+        return ord(text)
+    return int(text)
+
+
+def parse_script(lines: Iterable[str]) -> list[KeyEvent]:
+    events: list[KeyEvent] = []
+    for line in lines:
+        fields: list[str] = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        assert len(fields) in (2, 3), f"Expected 'cycle key [hold]', got {line!r}"
+        cycle: int = int(fields[0])
+        events.append(KeyEvent(cycle, key_code(fields[1])))
+        if len(fields) == 3:
+            events.append(KeyEvent(cycle + int(fields[2]), RELEASE))
+    return sorted(events, key=lambda event: event.cycle)
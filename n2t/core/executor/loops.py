@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+from n2t.core.executor.decoder import DEST_A, DEST_M, M_OPERAND, Instruction
+from n2t.core.executor.memory import KBD
+
+LOOP = 0b1000
+BACK = 0b10000
+
+
+class Loop(NamedTuple):
+    start: int
+    length: int
+    addresses: tuple[int, ...]
+
+
+def find_loops(program: list[Instruction]) -> dict[int, Loop]:
+    loops: dict[int, Loop] = {}
+    for end, instruction in enumerate(program):
+        if instruction.alu is None or not instruction.jump or instruction.dest:
+            continue
+        loop: Loop | None = loop_ending_at(program, end)
+        if loop is not None:
+            loops[end] = loop
+    return loops
+
+
+def loop_ending_at(program: list[Instruction], end: int) -> Loop | None:
+    target: int | None = jump_target(program, end)
+    if target is None or target > end:
+        return None
+    a: int = target
+    addresses: set[int] = set()
+    for pc in range(target, end + 1):
+        instruction: Instruction = program[pc]
+        if instruction.alu is None:
+            a = instruction.value
+            continue
+        if pc < end and (instruction.jump or instruction.dest & DEST_A):
+            return None
+        if instruction.value & M_OPERAND or instruction.dest & DEST_M:
+            if a == KBD:
+                return None
+            addresses.add(a)
+    if a != target:
+        return None
+    return Loop(target, end - target + 1, tuple(sorted(addresses)))
+
+
+def jump_target(program: list[Instruction], end: int) -> int | None:
+    for pc in range(end - 1, -1, -1):
+        instruction: Instruction = program[pc]
+        if instruction.alu is None:
+            return instruction.value
+        if instruction.jump or instruction.dest & DEST_A:
+            return None
+    return None
+
+
+def is_call(program: list[Instruction], end: int) -> bool:
+    for pc in range(end - 1, -1, -1):
+        instruction: Instruction = program[pc]
+        if instruction.alu is None and instruction.value == end + 1:
+            return True
+        if instruction.jump:
+            return False
+    return False
+
+
+def call_targets(program: list[Instruction]) -> list[int]:
+    targets: set[int | None] = {
+        jump_target(program, pc)
+        for pc, instruction in enumerate(program)
+        if instruction.jump and is_call(program, pc)
+    }
+    return sorted(target for target in targets if target is not None)
+
+
+def mark(
+    program: list[Instruction], ends: Iterable[int], bit: int
+) -> list[Instruction]:
+    marked: list[Instruction] = list(program)
+    for end in ends:
+        marked[end] = marked[end]._replace(jump=marked[end].jump | bit)
+    return marked
+
+
+def mark_loops(program: list[Instruction], loops: dict[int, Loop]) -> list[Instruction]:
+    return mark(program, loops, LOOP)
+
+
+def find_back_edges(program: list[Instruction]) -> list[int]:
+    edges: list[int] = []
+    for end, instruction in enumerate(program):
+        if not instruction.jump or instruction.dest or instruction.jump & LOOP:
+            continue
+        target: int | None = jump_target(program, end)
+        if target is not None and target <= end and not is_call(program, end):
+            edges.append(end)
+    return edges
+
+
+def mark_back_edges(program: list[Instruction]) -> list[Instruction]:
+    return mark(program, find_back_edges(program), BACK)
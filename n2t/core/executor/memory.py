@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping
+
+from n2t.core.executor.decoder import to_word
+
+RAM_SIZE = 32768
+SCREEN = 16384
+KBD = 24576
+
+
+def zeroed_words() -> array[int]:
+    return array("h", bytes(2 * RAM_SIZE))
+
+
+@dataclass
+class Memory:
+    words: array[int] = field(default_factory=zeroed_words)
+
+    @classmethod
+    def create(cls, values: Mapping[int, int] | None = None) -> Memory:
+        memory = cls()
+        memory.update(values or {})
+        return memory
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Memory:
+        if len(data) != 2 * RAM_SIZE:
+            raise ValueError("RAM image must hold exactly 32K words")
+        words: array[int] = array("h")
+        words.frombytes(data)
+        if sys.byteorder == "big":
+            words.byteswap()
+        return cls(words)
+
+    def __getitem__(self, address: int) -> int:
+        return self.words[address]
+
+    def __setitem__(self, address: int, value: int) -> None:
+        self.words[address] = to_word(value)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def update(self, values: Mapping[int, int]) -> None:
+        for address, value in values.items():
+            self[address] = value
+
+    def dump(self, ranges: Iterable[range] | None = None) -> dict[int, int]:
+        result: dict[int, int] = {}
+        for span in ranges or [range(RAM_SIZE)]:
+            start: int = span.start
+            for offset, value in enumerate(self.words[start : span.stop]):
+                if value:
+                    result[start + offset] = value
+        return result
+
+    def to_bytes(self, ranges: Iterable[range] | None = None) -> bytes:
+        chunk: array[int] = array("h")
+        for span in ranges or [range(RAM_SIZE)]:
+            chunk.extend(self.words[span.start : span.stop])
+        if sys.byteorder == "big":
+            chunk.byteswap()
+        return chunk.tobytes()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, NamedTuple
+
+from n2t.core.executor.decoder import Instruction
+from n2t.core.executor.loops import call_targets, is_call, jump_target
+
+
+class Hotspot(NamedTuple):
+    start: int
+    end: int
+    entries: int
+    cycles: int
+
+
+@dataclass
+class Profile:
+    hits: list[int]
+    taken: list[int]
+    not_taken: list[int]
+    edges: dict[tuple[int, int], int] = field(default_factory=dict)
+
+    @classmethod
+    def create(cls, size: int) -> Profile:
+        return cls([0] * size, [0] * size, [0] * size)
+
+    @property
+    def total(self) -> int:
+        return sum(self.hits)
+
+    def cycles(self, start: int, end: int) -> int:
+        return sum(self.hits[start : end + 1])
+
+    def blocks(self) -> list[Hotspot]:
+        leaders: set[int] = {0, len(self.hits)}
+        for source, target in self.edges:
+            leaders.update((target, source + 1))
+        for pc, count in enumerate(self.not_taken):
+            if count:
+                leaders.add(pc + 1)
+        bounds: list[int] = sorted(
+            leader for leader in leaders if leader <= len(self.hits)
+        )
+        blocks: list[Hotspot] = [
+            Hotspot(start, stop - 1, self.hits[start], self.cycles(start, stop - 1))
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+        return ranked(block for block in blocks if block.cycles)
+
+    def loops(self, program: list[Instruction]) -> list[Hotspot]:
+        entries: list[int] = call_targets(program)
+        return ranked(
+            Hotspot(target, source, count, self.cycles(target, source))
+            for (source, target), count in self.edges.items()
+            if target <= source
+            and jump_target(program, source) == target
+            and not is_call(program, source)
+            and bisect_right(entries, target) == bisect_right(entries, source)
+        )
+
+    def branches(self) -> list[tuple[int, int, int]]:
+        return sorted(
+            (
+                (pc, taken, not_taken)
+                for pc, (taken, not_taken) in enumerate(zip(self.taken, self.not_taken))
+                if taken + not_taken
+            ),
+            key=lambda branch: -(branch[1] + branch[2]),
+        )
+
+
+def ranked(hotspots: Iterable[Hotspot]) -> list[Hotspot]:
+    return sorted(hotspots, key=lambda hotspot: -hotspot.cycles)
+
+
+@dataclass(frozen=True)
+class SourceMap:
+    labels: list[tuple[int, str]] = field(default_factory=list)
+    lines: dict[int, tuple[int, str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_assembly(cls, assembly: Iterable[str]) -> SourceMap:
+        labels: list[tuple[int, str]] = []
+        lines: dict[int, tuple[int, str]] = {}
+        address: int = 0
+        for number, line in enumerate(assembly, start=1):
+            code: str = line.split("//")[0].strip()
+            if code.startswith("("):
+                labels.append((address, code[1 : code.find(")")]))
+            elif "@" in code or "=" in code or ";" in code:
+                lines[address] = (number, code)
+                address += 1
+        return cls(labels, lines)
+
+    def describe(self, address: int) -> str:
+        index: int = bisect_right(self.labels, address, key=lambda label: label[0]) - 1
+        where: str = f"{address}"
+        if index >= 0:
+            start, label = self.labels[index]
+            where = f"{label}+{address - start}" if address > start else label
+        if address in self.lines:
+            number, code = self.lines[address]
+            where += f" (line {number}: {code})"
+        return where
+
+
+def render_report(
+    profile: Profile,
+    program: list[Instruction],
+    source: SourceMap,
+    limit: int = 20,
+) -> list[str]:
+    total: int = profile.total or 1
+    report: list[str] = [f"Executed {profile.total} instructions", ""]
+    for title, hotspots, entries in [
+        ("Hottest blocks", profile.blocks(), "entries"),
+        ("Hottest loops", profile.loops(program), "iterations"),
+    ]:
+        report.append(title)
+        report.append(f"{'cycles':>12} {'share':>7} {entries:>12}  range  location")
+        for hotspot in hotspots[:limit]:
+            report.append(
+                f"{hotspot.cycles:>12} {hotspot.cycles / total:>7.1%} "
+                f"{hotspot.entries:>12}  {hotspot.start}-{hotspot.end}  "
+                f"{source.describe(hotspot.start)}"
+            )
+        report.append("")
+    report.append("Hottest branches")
+    report.append(f"{'taken':>12} {'not taken':>12}  location")
+    for pc, taken, not_taken in profile.branches()[:limit]:
+        report.append(f"{taken:>12} {not_taken:>12}  {source.describe(pc)}")
+    return report
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterator, Sequence
+
+from n2t.core.executor.memory import KBD, SCREEN
+
+WIDTH = 512
+HEIGHT = 256
+SCREEN_WORDS = KBD - SCREEN
+ROW_BYTES = WIDTH // 8
+FRAME_BYTES = ROW_BYTES * HEIGHT
+
+MAGIC = b"N2TF\x01"
+FRAME = struct.Struct("<QH")
+ROW = struct.Struct("<B")
+
+WHITE = b"\xff\xff\xff"
+BLACK = b"\x00\x00\x00"
+
+PIXELS: list[bytes] = [
+    b"".join(BLACK if byte >> bit & 1 else WHITE for bit in range(8))
+    for byte in range(256)
+]
+
+REVERSED: bytes = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+
+
+def screen_bytes(words: Sequence[int]) -> bytes:
+    assert len(words) == SCREEN_WORDS, "Screen must hold exactly 8K words"
+    chunk: array[int] = array("h", words)
+    if sys.byteorder == "big":
+        chunk.byteswap()
+    return chunk.tobytes()
+
+
+def render_ppm(words: Sequence[int]) -> bytes:
+    header: bytes = f"P6\n{WIDTH} {HEIGHT}\n255\n".encode()
+    return header + b"".join(PIXELS[byte] for byte in screen_bytes(words))
+
+
+def render_pbm(words: Sequence[int]) -> bytes:
+    header: bytes = f"P4\n{WIDTH} {HEIGHT}\n".encode()
+    return header + screen_bytes(words).translate(REVERSED)
+
+
+@dataclass
+class ScreenTracker:
+    previous: bytes = bytes(FRAME_BYTES)
+
+    def changes(self, words: Sequence[int]) -> list[tuple[int, bytes]]:
+        current: bytes = screen_bytes(words)
+        previous: bytes = self.previous
+        if current == previous:
+            return []
+        self.previous = current
+        return [
+            (row, current[start : start + ROW_BYTES])
+            for row, start in enumerate(range(0, FRAME_BYTES, ROW_BYTES))
+            if current[start : start + ROW_BYTES] != previous[start : start + ROW_BYTES]
+        ]
+
+
+def encode_frame(cycle: int, rows: list[tuple[int, bytes]]) -> bytes:
+    return FRAME.pack(cycle, len(rows)) + b"".join(
+        ROW.pack(row) + data for row, data in rows
+    )
+
+
+@dataclass
+class FrameReader:
+    data: bytes
+    screen: bytearray = field(default_factory=lambda: bytearray(FRAME_BYTES))
+
+    def __iter__(self) -> Iterator[tuple[int, bytes]]:
+        assert self.data.startswith(MAGIC), "Not a frame stream"
+        offset: int = len(MAGIC)
+        while offset < len(self.data):
+            cycle, count = FRAME.unpack_from(self.data, offset)
+            offset += FRAME.size
+            for _ in range(count):
+                (row,) = ROW.unpack_from(self.data, offset)
+                offset += ROW.size
+                start: int = row * ROW_BYTES
+                self.screen[start : start + ROW_BYTES] = self.data[
+                    offset : offset + ROW_BYTES
+                ]
+                offset += ROW_BYTES
+            yield cycle, bytes(self.screen)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Iterable
+
+MAGIC = b"N2TS\x01"
+HEADER = struct.Struct("<32sQHhh?")
+
+
+def rom_digest(rom: Iterable[str]) -> bytes:
+    return hashlib.sha256("\n".join(rom).encode()).digest()
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    rom: bytes
+    cycle: int
+    PC: int
+    A: int
+    D: int
+    halted: bool
+    RAM: bytes
+
+    def to_bytes(self) -> bytes:
+        header: bytes = HEADER.pack(
+            self.rom, self.cycle, self.PC, self.A, self.D, self.halted
+        )
+        return MAGIC + header + zlib.compress(self.RAM)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Snapshot:
+        body: bytes = data[len(MAGIC) :]
+        if not data.startswith(MAGIC) or len(body) < HEADER.size:
+            raise ValueError("Not an n2t snapshot")
+        rom, cycle, pc, a, d, halted = HEADER.unpack_from(body)
+        try:
+            ram: bytes = zlib.decompress(body[HEADER.size :])
+        except zlib.error as error:
+            raise ValueError("Snapshot RAM image is corrupt") from error
+        return cls(rom, cycle, pc, a, d, halted, ram)
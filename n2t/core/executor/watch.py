@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import operator
+import re
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, NamedTuple
+
+COMPARISONS: dict[str, Callable[[int, int], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+PREDICATE = re.compile(
+    r"^\s*(?:RAM\[(?P<address>\d+)\]|(?P<register>[ADP]C?))\s*"
+    r"(?P<operator>==|!=|<=|>=|<|>)\s*(?P<value>-?\d+)\s*$"
+)
+
+
+class Predicate(NamedTuple):
+    text: str
+    target: int | str
+    compare: Callable[[int, int], bool]
+    value: int
+
+    def holds(self, ram: array[int], a: int, d: int, pc: int) -> bool:
+        if isinstance(self.target, int):
+            current: int = ram[self.target]
+        else:
+            current = {"A": a, "D": d, "PC": pc}[self.target]
+        return self.compare(current, self.value)
+
+
+def parse_predicate(text: str) -> Predicate:
+    match: re.Match[str] | None = PREDICATE.match(text)
+    if match is None or match["register"] not in (None, "A", "D", "PC"):
+        raise ValueError(
+            f"Expected 'RAM[n] op value' or 'A|D|PC op value', got {text!r}"
+        )
+    target: int | str = int(match["address"]) if match["address"] else match["register"]
+    return Predicate(
+        text.strip(), target, COMPARISONS[match["operator"]], int(match["value"])
+    )
+
+
+class Hit(NamedTuple):
+    reason: str
+    cycle: int
+    PC: int
+
+    def describe(self) -> str:
+        return f"Stopped on {self.reason} at cycle {self.cycle}, PC={self.PC}"
+
+
+@dataclass
+class Watches:
+    breakpoints: set[int] = field(default_factory=set)
+    reads: set[int] = field(default_factory=set)
+    writes: set[int] = field(default_factory=set)
+    predicates: list[Predicate] = field(default_factory=list)
+
+    @classmethod
+    def create(
+        cls,
+        breakpoints: Iterable[int] = (),
+        reads: Iterable[int] = (),
+        writes: Iterable[int] = (),
+        predicates: Iterable[str] = (),
+    ) -> Watches:
+        return cls(
+            set(breakpoints),
+            set(reads),
+            set(writes),
+            [parse_predicate(text) for text in predicates],
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.breakpoints or self.reads or self.writes or self.predicates)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any, Sequence
+
+from n2t.core.executor import BlockCompiler, Instruction
+from n2t.core.executor.analysis import Analysis
+from n2t.core.executor.blocks import Block, block_namespace, find_leaders
+from n2t.core.executor.loops import Loop
+from n2t.infra.rom import PackedRom, decode_rom, pack_text, read_rom
+
+MAGIC = b"N2TC\x04"
+CACHE_DIRECTORY = "__pycache__"
+
+
+@dataclass(frozen=True)
+class CompiledProgram:
+    rom: Sequence[str]
+    blocks: dict[int, Block]
+    analysis: Analysis
+
+    @classmethod
+    def load_from(cls, file_name: str) -> CompiledProgram:
+        path: Path = Path(file_name)
+        source: bytes = path.read_bytes()
+        digest: bytes = hashlib.sha256(MAGIC + source).digest()
+        cache: Path = cache_path(path)
+        code: CodeType | None = read_cache(cache, digest)
+        if code is None:
+            code = compile(
+                module_source(read_rom(source, path.suffix)), str(cache), "exec"
+            )
+            write_cache(cache, digest, code)
+        namespace: dict[str, Any] = block_namespace()
+        exec(code, namespace)
+        rom: PackedRom = PackedRom.from_bytes(namespace["ROM"])
+        return cls(
+            rom,
+            {start: Block(*entry) for start, entry in namespace["BLOCKS"].items()},
+            Analysis.restore(
+                decode_rom(rom),
+                {end: Loop(*loop) for end, loop in namespace["LOOPS"].items()},
+                namespace["BACKS"],
+                namespace["MACROS"],
+            ),
+        )
+
+    def compiler(self, program: list[Instruction]) -> BlockCompiler:
+        return BlockCompiler(program, dict(self.blocks))
+
+
+def module_source(rom: Sequence[str]) -> str:
+    analysis: Analysis = Analysis.of(decode_rom(rom))
+    compiler: BlockCompiler = BlockCompiler(analysis.program)
+    loops: dict[int, tuple[int, int, tuple[int, ...]]] = {
+        end: (loop.start, loop.length, loop.addresses)
+        for end, loop in analysis.loops.items()
+    }
+    return "\n".join(
+        [
+            f"ROM = {pack_text(rom)!r}",
+            f"LOOPS = {loops!r}",
+            f"BACKS = {analysis.backs!r}",
+            f"MACROS = {analysis.indices!r}",
+            compiler.module_source(find_leaders(analysis.program)),
+        ]
+    )
+
+
+def cache_path(path: Path) -> Path:
+    tag: str = sys.implementation.cache_tag or "python"
+    return path.parent / CACHE_DIRECTORY / f"{path.name}.{tag}.n2tc"
+
+
+def read_cache(cache: Path, digest: bytes) -> CodeType | None:
+    try:
+        data: bytes = cache.read_bytes()
+    except OSError:
+        return None
+    header: bytes = MAGIC + digest
+    if not data.startswith(header):
+        return None
+    try:
+        code: Any = marshal.loads(data[len(header) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return code if isinstance(code, CodeType) else None
+
+
+def write_cache(cache: Path, digest: bytes, code: CodeType) -> None:
+    temporary: Path = cache.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_bytes(MAGIC + digest + marshal.dumps(code))
+        os.replace(temporary, cache)
+    except OSError:
+        pass
@@ -5,24 +5,47 @@ from pathlib import Path
 from typing import Iterable, Iterator, Protocol
 
 from n2t.core import Assembler as DefaultAssembler
+from n2t.core.assembler.facade import PARALLEL_THRESHOLD
 from n2t.infra.io import File, FileFormat
+from n2t.infra.rom import pack_text
 
 
 @dataclass
 class AsmProgram:
     path: Path
     assembler: Assembler = field(default_factory=DefaultAssembler.create)
+    streaming: bool = False
+    packed: bool = False
 
     @classmethod
-    def load_from(cls, file_name: str) -> AsmProgram:
-        return cls(Path(file_name))
+    def load_from(
+        cls,
+        file_name: str,
+        streaming: bool = False,
+        threshold: int = PARALLEL_THRESHOLD,
+        workers: int | None = None,
+        packed: bool = False,
+    ) -> AsmProgram:
+        return cls(
+            Path(file_name),
+            DefaultAssembler.create(threshold, workers),
+            streaming,
+            packed,
+        )
 
     def __post_init__(self) -> None:
         FileFormat.asm.validate(self.path)
 
     def assemble(self) -> None:
-        hack_file = File(FileFormat.hack.convert(self.path))
-        hack_file.save(self.assembler.assemble(self))
+        words: Iterable[str] = (
+            self.assembler.stream(self)
+            if self.streaming
+            else self.assembler.assemble(self)
+        )
+        if self.packed:
+            FileFormat.packed.convert(self.path).write_bytes(pack_text(words))
+        else:
+            File(FileFormat.hack.convert(self.path)).save(words)
 
     def __iter__(self) -> Iterator[str]:
         yield from File(self.path).load()
@@ -31,3 +54,6 @@ class AsmProgram:
 class Assembler(Protocol):  # pragma: no cover
     def assemble(self, assembly: Iterable[str]) -> Iterable[str]:
         pass
+
+    def stream(self, assembly: Iterable[str]) -> Iterator[str]:
+        pass
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from n2t.core.executor.batch import BatchExecutor
+from n2t.infra.rom import decode_rom, load_rom
+
+
+@dataclass
+class BatchProgram:
+    path: Path
+    executor: BatchExecutor
+    cycles: int
+
+    @classmethod
+    def load_from(cls, file_name: str, inputs_file: str, cycles: int) -> BatchProgram:
+        path: Path = Path(file_name)
+        with open(inputs_file, "r") as inputs:
+            initial: list[dict[int, int]] = [
+                {int(address): value for address, value in ram.items()}
+                for ram in json.load(inputs)
+            ]
+        program = decode_rom(load_rom(path))
+        return cls(path, BatchExecutor.create(program, initial), cycles)
+
+    def execute(self) -> None:
+        self.executor.run(self.cycles)
+
+    def dump_json(self) -> None:
+        with open(self.path.with_suffix(".json"), "w") as json_file:
+            json.dump(self.executor.dump(), json_file, indent=4)
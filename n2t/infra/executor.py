@@ -1,174 +1,642 @@
 import json
+from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Self
+from typing import Iterable, Iterator, Self, Sequence
 
-from n2t.core import Assembler
+from n2t.core.executor import BlockCompiler, Instruction, Memory
+from n2t.core.executor.affine import ATTEMPTS, MIN_SKIP, skip_iterations
+from n2t.core.executor.analysis import Analysis
+from n2t.core.executor.blocks import Block
+from n2t.core.executor.decoder import (
+    ADDRESS_MASK,
+    DEST_A,
+    DEST_D,
+    DEST_M,
+    JEQ,
+    JGT,
+    JLT,
+    M_OPERAND,
+    Halt,
+    pad,
+)
+from n2t.core.executor.heatmap import Heatmap, render_heatmap
+from n2t.core.executor.history import NO_WRITE, History
+from n2t.core.executor.hooks import SP, Routine, call, find_routines
+from n2t.core.executor.idioms import Macro, MacroFunction
+from n2t.core.executor.keyboard import KeyEvent
+from n2t.core.executor.loops import BACK, LOOP, Loop
+from n2t.core.executor.memory import KBD
+from n2t.core.executor.profile import Profile, SourceMap, render_report
+from n2t.core.executor.snapshot import Snapshot, rom_digest
+from n2t.core.executor.watch import Hit, Predicate, Watches
+from n2t.infra.aot import CompiledProgram
+from n2t.infra.io import File
+from n2t.infra.rom import decode_rom, load_rom
+from n2t.infra.shared import SharedRAM
 
 
 @dataclass
 class Executor:
     current_file: str
-    ROM: list[str]
+    ROM: Sequence[str]
     ticks: int
-    RAM: dict[int, int] = field(default_factory=lambda: {})
+    RAM: Memory = field(default_factory=Memory)
     A: int = field(default_factory=lambda: 0)
     D: int = field(default_factory=lambda: 0)
-    powers: list[int] = field(default_factory=lambda: [2**i for i in range(16)])
-    comp_table: dict[str, str] = field(
-        default_factory=lambda: {
-            "101010": "0",
-            "111111": "1",
-            "111010": "-1",
-            "001100": "D",
-            "110000": "A",
-            "001101": "!D",
-            "110001": "!A",
-            "001111": "-D",
-            "110011": "-A",
-            "011111": "D+1",
-            "110111": "A+1",
-            "001110": "D-1",
-            "110010": "A-1",
-            "000010": "D+A",
-            "010011": "D-A",
-            "000111": "A-D",
-            "000000": "D&A",
-            "010101": "D|A",
-        }
+    PC: int = field(default_factory=lambda: 0)
+    jit: bool = False
+    program: list[Instruction] = field(default_factory=list, repr=False)
+    analysis: Analysis | None = field(default=None, repr=False)
+    cycle: int = field(default_factory=lambda: 0)
+    halted: bool = False
+    loops: dict[int, Loop] = field(init=False, repr=False)
+    loop_states: dict[int, tuple[int, tuple[int, ...]]] = field(
+        init=False, repr=False, default_factory=dict
     )
+    compiler: BlockCompiler = field(init=False, repr=False)
+    macros: list[Macro | None] = field(init=False, repr=False)
+    profile: Profile | None = field(default=None, repr=False)
+    hooked: dict[Routine, int] = field(default_factory=dict, repr=False)
+    watches: Watches | None = field(default=None, repr=False)
+    heatmap: Heatmap | None = field(default=None, repr=False)
+    history: History | None = field(default=None, repr=False)
+    hit: Hit | None = field(default=None, init=False, repr=False)
+    loop_misses: dict[int, int] = field(init=False, repr=False, default_factory=dict)
 
-    @staticmethod
-    def get_jmp(bits: str, comp: int) -> bool:
-        res: bool = False
-        if bits[0] == "1":
-            res = res or comp < 0
-        if bits[1] == "1":
-            res = res or comp == 0
-        if bits[2] == "1":
-            res = res or comp > 0
-        return res
-
-    @staticmethod
-    def get_dest(bits: str) -> str:
-        result: str = ""
-        if bits[0] == "1":
-            result += "A"
-        if bits[1] == "1":
-            result += "D"
-        if bits[2] == "1":
-            result += "M"
-        return result
-
-    def get_value(self, bits: str) -> int:
-        result: int = 0
-        for i in range(16):
-            if bits[15 - i] == "0":
-                continue
-            result += self.powers[i]
-        return result
+    def __post_init__(self) -> None:
+        analysis: Analysis = self.analysis or Analysis.of(
+            self.program or decode_rom(self.ROM)
+        )
+        self.analysis = analysis
+        self.loops = analysis.loops
+        self.program = analysis.program
+        self.compiler = BlockCompiler(self.program)
+        self.macros = list(analysis.macros)
 
-    def get_m(self) -> int:
-        if self.A in self.RAM:
-            return self.RAM[self.A]
-        else:
-            self.RAM[self.A] = 0
-            return 0
-
-    def evaluate_comp(self, bits: str) -> int:
-        comp_str: str = self.comp_table[bits[1:]]
-        if comp_str == "0":
-            return 0
-        if comp_str == "1":
-            return 1
-        if comp_str == "-1":
-            return -1
-        cur_a: int = self.A
-        if "A" in comp_str and bits[0] == "1":
-            cur_a = self.get_m()
-        if comp_str == "D":
-            return self.D
-        if comp_str == "A":
-            return cur_a
-        if comp_str == "!D":
-            return ~self.D
-        if comp_str == "!A":
-            return ~cur_a
-        if comp_str == "-D":
-            return -1 * self.D
-        if comp_str == "-A":
-            return -1 * cur_a
-        if comp_str == "D+1":
-            return self.D + 1
-        if comp_str == "A+1":
-            return cur_a + 1
-        if comp_str == "D-1":
-            return self.D - 1
-        if comp_str == "A-1":
-            return cur_a - 1
-        if comp_str == "D+A":
-            return self.D + cur_a
-        if comp_str == "D-A":
-            return self.D - cur_a
-        if comp_str == "A-D":
-            return cur_a - self.D
-        if comp_str == "D&A":
-            return self.D & cur_a
-        if comp_str == "D|A":
-            return self.D | cur_a
-        return -1
-
-    def assign_dest(self, dest: str, comp: int) -> None:
-        for reg in dest:
-            if reg == "A":
-                self.A = comp
-            if reg == "D":
-                self.D = comp
-            if reg == "M":
-                self.RAM[self.A] = comp
+    @cached_property
+    def padded(self) -> list[Instruction]:
+        return pad(self.program)
 
     def compile(self) -> None:
-        tick: int = self.ticks
-        inf: bool = tick == -1
-        line_ind: int = 0
-        while inf or tick >= 0:
+        self.advance(self.ticks)
+
+    def advance(self, cycles: int) -> None:
+        if self.profile is not None:
+            self.run_profiled(cycles, self.profile)
+        elif self.watches:
+            self.run_watched(cycles, self.watches)
+        elif self.heatmap is not None:
+            self.run_counted(cycles, self.heatmap)
+        elif self.history is not None:
+            self.run_recorded(cycles, self.history)
+        elif self.jit:
+            self.run_blocks(cycles)
+        elif cycles < 0:
+            self.run_unbounded()
+        else:
+            self.run(cycles)
+
+    def steps(
+        self, interval: int = 0, events: Iterable[KeyEvent] = ()
+    ) -> Iterator[int]:
+        end: int = self.cycle + self.ticks if self.ticks >= 0 else -1
+        mark: int = self.cycle + interval if interval > 0 else -1
+        pending: Iterator[KeyEvent] = iter(events)
+        event: KeyEvent | None = next(pending, None)
+        while self.cycle != end and not self.halted:
+            while event is not None and event.cycle <= self.cycle:
+                self.RAM[KBD] = event.key
+                event = next(pending, None)
+            stops: list[int] = [
+                stop for stop in (mark, end, event.cycle if event else -1) if stop >= 0
+            ]
+            self.advance(min(stops) - self.cycle if stops else -1)
+            if self.cycle in (mark, end) or self.halted or self.hit is not None:
+                yield self.cycle
+            if self.hit is not None:
+                return
+            if self.cycle == mark:
+                mark += interval
+
+    def play(self, events: Iterable[KeyEvent]) -> None:
+        for _ in self.steps(events=events):
+            pass
+
+    def run(self, cycles: int) -> None:
+        program: list[Instruction] = self.program
+        macros: list[Macro | None] = self.macros
+        size: int = len(program)
+        ram: array[int] = self.RAM.words
+        a: int = self.A
+        d: int = self.D
+        pc: int = self.PC
+        tick: int = cycles
+        while tick > 0:
+            if pc >= size:
+                self.halted = True
+                break
             tick -= 1
-            if line_ind >= len(self.ROM):
-                if inf:
+            alu, value, dest, jump = program[pc]
+            if alu is None:
+                macro: Macro | None = macros[pc]
+                if macro is None or macro.length > tick + 1:
+                    a = value
+                    pc += 1
+                    continue
+                pc, a, d = macro.run(pc, value, d, ram)
+                tick -= macro.length - 1
+                continue
+            out: int = alu(d, ram[a] if value & M_OPERAND else a)
+            if jump and jump & (JLT if out < 0 else JEQ if out == 0 else JGT):
+                if jump & LOOP and self.settled(pc, d, self.cycle + cycles - tick):
+                    self.halted = True
+                    tick += self.loops[pc].length
+                    pc = a & ADDRESS_MASK
                     break
+                pc = a & ADDRESS_MASK
+                if jump & BACK:
+                    a, d, skipped = self.skip_loop(pc, a, d, tick)
+                    tick -= skipped
+            else:
+                pc += 1
+            if dest & DEST_M:
+                ram[a] = out
+            if dest & DEST_D:
+                d = out
+            if dest & DEST_A:
+                a = out
+        self.A = a
+        self.D = d
+        self.PC = pc
+        self.cycle += cycles - tick
+
+    def run_unbounded(self) -> None:
+        program: list[Instruction] = self.padded
+        macros: list[Macro | None] = self.macros
+        ram: array[int] = self.RAM.words
+        a: int = self.A
+        d: int = self.D
+        pc: int = self.PC
+        tick: int = 0
+        try:
+            while True:
+                alu, value, dest, jump = program[pc]
+                if alu is None:
+                    macro: Macro | None = macros[pc]
+                    if macro is None:
+                        a = value
+                        pc += 1
+                        tick += 1
+                        continue
+                    pc, a, d = macro.run(pc, value, d, ram)
+                    tick += macro.length
+                    continue
+                out: int = alu(d, ram[a] if value & M_OPERAND else a)
+                tick += 1
+                if jump and jump & (JLT if out < 0 else JEQ if out == 0 else JGT):
+                    if jump & LOOP and self.settled(pc, d, self.cycle + tick):
+                        tick -= self.loops[pc].length
+                        pc = a & ADDRESS_MASK
+                        break
+                    pc = a & ADDRESS_MASK
+                    if jump & BACK:
+                        a, d, skipped = self.skip_loop(pc, a, d, -1)
+                        tick += skipped
+                else:
+                    pc += 1
+                if dest & DEST_M:
+                    ram[a] = out
+                if dest & DEST_D:
+                    d = out
+                if dest & DEST_A:
+                    a = out
+        except Halt:
+            pass
+        self.halted = True
+        self.A = a
+        self.D = d
+        self.PC = pc
+        self.cycle += tick
+
+    def run_blocks(self, cycles: int) -> None:
+        block_at = self.compiler.block_at
+        size: int = len(self.program)
+        ram: array[int] = self.RAM.words
+        a: int = self.A
+        d: int = self.D
+        pc: int = self.PC
+        tick: int = cycles
+        inf: bool = tick < 0
+        while pc < size:
+            run, length, loop, back = block_at(pc)
+            if not inf and length > tick:
+                break
+            pc, a, d = run(a, d, ram)
+            tick -= length
+            if 0 <= pc <= loop and self.settled(loop, d, self.cycle + cycles - tick):
+                self.halted = True
+                tick += self.loops[loop].length
+                break
+            if pc == back:
+                a, d, skipped = self.skip_loop(pc, a, d, -1 if inf else tick)
+                tick -= skipped
+        self.A = a
+        self.D = d
+        self.PC = pc
+        self.cycle += cycles - tick
+        self.halted = self.halted or pc >= size
+        if not self.halted and not inf:
+            self.run(tick)
+
+    def run_profiled(self, cycles: int, profile: Profile) -> None:
+        program: list[Instruction] = self.program
+        size: int = len(program)
+        ram: array[int] = self.RAM.words
+        hits: list[int] = profile.hits
+        edges: dict[tuple[int, int], int] = profile.edges
+        a: int = self.A
+        d: int = self.D
+        pc: int = self.PC
+        tick: int = cycles
+        inf: bool = tick < 0
+        while inf or tick > 0:
+            if pc >= size:
+                self.halted = True
+                break
+            tick -= 1
+            hits[pc] += 1
+            alu, value, dest, jump = program[pc]
+            if alu is None:
+                a = value
+                pc += 1
                 continue
-            cur_line: str = self.ROM[line_ind]
-            if cur_line[0] == "0":
-                self.A = self.get_value(cur_line)
-                line_ind += 1
+            out: int = alu(d, ram[a] if value & M_OPERAND else a)
+            if jump and jump & (JLT if out < 0 else JEQ if out == 0 else JGT):
+                profile.taken[pc] += 1
+                edge: tuple[int, int] = (pc, a & ADDRESS_MASK)
+                edges[edge] = edges.get(edge, 0) + 1
+                if jump & LOOP and self.settled(pc, d, self.cycle + cycles - tick):
+                    self.halted = True
+                    tick += self.loops[pc].length
+                    pc = a & ADDRESS_MASK
+                    break
+                pc = a & ADDRESS_MASK
+            else:
+                if jump:
+                    profile.not_taken[pc] += 1
+                pc += 1
+            if dest & DEST_M:
+                ram[a] = out
+            if dest & DEST_D:
+                d = out
+            if dest & DEST_A:
+                a = out
+        self.A = a
+        self.D = d
+        self.PC = pc
+        self.cycle += cycles - tick
+
+    def run_recorded(self, cycles: int, history: History) -> None:
+        remaining: int = cycles
+        while remaining and not self.halted:
+            if self.cycle >= history.next_snapshot:
+                history.keep(self.snapshot())
+            chunk: int = history.next_snapshot - self.cycle
+            if remaining > 0:
+                chunk = min(chunk, remaining)
+                remaining -= chunk
+            self.record(chunk, history)
+
+    def record(self, cycles: int, history: History) -> None:
+        program: list[Instruction] = self.program
+        size: int = len(program)
+        ram: array[int] = self.RAM.words
+        push = history.push
+        a: int = self.A
+        d: int = self.D
+        pc: int = self.PC
+        tick: int = cycles
+        while tick > 0:
+            if pc >= size:
+                self.halted = True
+                break
+            tick -= 1
+            alu, value, dest, jump = program[pc]
+            if alu is None:
+                push(pc, a, d, NO_WRITE, 0)
+                a = value
+                pc += 1
+                continue
+            push(pc, a, d, a if dest & DEST_M else NO_WRITE, ram[a])
+            out: int = alu(d, ram[a] if value & M_OPERAND else a)
+            if jump and jump & (JLT if out < 0 else JEQ if out == 0 else JGT):
+                if jump & LOOP and self.settled(pc, d, self.cycle + cycles - tick):
+                    self.halted = True
+                    tick += self.loops[pc].length
+                    history.drop(self.loops[pc].length)
+                    pc = a & ADDRESS_MASK
+                    break
+                pc = a & ADDRESS_MASK
+            else:
+                pc += 1
+            if dest & DEST_M:
+                ram[a] = out
+            if dest & DEST_D:
+                d = out
+            if dest & DEST_A:
+                a = out
+        self.A = a
+        self.D = d
+        self.PC = pc
+        self.cycle += cycles - tick
+
+    def step_back(self, cycles: int = 1) -> None:
+        history: History | None = self.history
+        assert history is not None, "Recording was not enabled"
+        target: int = self.cycle - cycles
+        if target < 0:
+            raise ValueError(f"Cannot step back before cycle 0 from {self.cycle}")
+        ram: array[int] = self.RAM.words
+        while self.cycle > target and history.size:
+            self.PC, self.A, self.D, address, old = history.pop()
+            if address != NO_WRITE:
+                ram[address] = old
+            self.cycle -= 1
+        self.halted = False
+        self.loop_states.clear()
+        if self.cycle > target:
+            self.restore(history.before(target))
+            history.clear()
+            self.run_recorded(target - self.cycle, history)
+
+    def run_counted(self, cycles: int, heatmap: Heatmap) -> None:
+        program: list[Instruction] = self.program
+        size: int = len(program)
+        ram: array[int] = self.RAM.words
+        reads: list[int] = heatmap.reads
+        writes: list[int] = heatmap.writes
+        max_sp: int = max(heatmap.max_sp, ram[SP])
+        a: int = self.A
+        d: int = self.D
+        pc: int = self.PC
+        tick: int = cycles
+        inf: bool = tick < 0
+        while inf or tick > 0:
+            if pc >= size:
+                self.halted = True
+                break
+            tick -= 1
+            alu, value, dest, jump = program[pc]
+            if alu is None:
+                a = value
+                pc += 1
                 continue
-            dest: str = Executor.get_dest(cur_line[10:13])
-            comp: int = self.evaluate_comp(cur_line[3:10])
-            self.assign_dest(dest, comp)
-            jmp: bool = Executor.get_jmp(cur_line[13:], comp)
-            if jmp:
-                line_ind = self.A
+            if value & M_OPERAND:
+                reads[a] += 1
+            out: int = alu(d, ram[a] if value & M_OPERAND else a)
+            if jump and jump & (JLT if out < 0 else JEQ if out == 0 else JGT):
+                if jump & LOOP and self.settled(pc, d, self.cycle + cycles - tick):
+                    self.halted = True
+                    tick += self.loops[pc].length
+                    pc = a & ADDRESS_MASK
+                    break
+                pc = a & ADDRESS_MASK
             else:
-                line_ind += 1
+                pc += 1
+            if dest & DEST_M:
+                ram[a] = out
+                writes[a] += 1
+                if a == SP and out > max_sp:
+                    max_sp = out
+            if dest & DEST_D:
+                d = out
+            if dest & DEST_A:
+                a = out
+        heatmap.max_sp = max_sp
+        self.A = a
+        self.D = d
+        self.PC = pc
+        self.cycle += cycles - tick
+
+    def run_watched(self, cycles: int, watches: Watches) -> None:
+        program: list[Instruction] = self.program
+        size: int = len(program)
+        ram: array[int] = self.RAM.words
+        breakpoints: set[int] = watches.breakpoints
+        reads: set[int] = watches.reads
+        writes: set[int] = watches.writes
+        predicates: list[Predicate] = watches.predicates
+        a: int = self.A
+        d: int = self.D
+        pc: int = self.PC
+        tick: int = cycles
+        inf: bool = tick < 0
+        resumed: bool = self.hit is not None and self.hit.PC == pc
+        reason: str = ""
+        self.hit = None
+        while inf or tick > 0:
+            if pc >= size:
+                self.halted = True
+                break
+            if pc in breakpoints and not resumed:
+                reason = f"breakpoint {pc}"
+                break
+            resumed = False
+            tick -= 1
+            alu, value, dest, jump = program[pc]
+            if alu is None:
+                a = value
+                pc += 1
+            else:
+                address: int = a
+                out: int = alu(d, ram[a] if value & M_OPERAND else a)
+                if jump and jump & (JLT if out < 0 else JEQ if out == 0 else JGT):
+                    if jump & LOOP and self.settled(pc, d, self.cycle + cycles - tick):
+                        self.halted = True
+                        tick += self.loops[pc].length
+                        pc = a & ADDRESS_MASK
+                        break
+                    pc = a & ADDRESS_MASK
+                else:
+                    pc += 1
+                if dest & DEST_M:
+                    ram[a] = out
+                if dest & DEST_D:
+                    d = out
+                if dest & DEST_A:
+                    a = out
+                if value & M_OPERAND and address in reads:
+                    reason = f"read of RAM[{address}]"
+                if dest & DEST_M and address in writes:
+                    reason = f"write of {out} to RAM[{address}]"
+            for predicate in predicates:
+                if predicate.holds(ram, a, d, pc):
+                    reason = predicate.text
+            if reason:
+                break
+        self.A = a
+        self.D = d
+        self.PC = pc
+        self.cycle += cycles - tick
+        if reason:
+            self.hit = Hit(reason, self.cycle, pc)
+
+    def install_hooks(self, labels: Iterable[tuple[int, str]]) -> None:
+        for address, routine in find_routines(labels).items():
+            if self.program[address].alu is not None:
+                continue
+            run: MacroFunction = self.hook(address, routine)
+            self.macros[address] = Macro(run, 1)
+            self.compiler.cache[address] = Block(partial(run, address), 1)
+
+    def hook(self, address: int, routine: Routine) -> MacroFunction:
+        value: int = self.program[address].value
+
+        def run(pc: int, a: int, d: int, ram: "array[int]") -> tuple[int, int, int]:
+            returned: tuple[int, int] | None = call(routine, ram)
+            if returned is None:
+                return pc + 1, value, d
+            self.hooked[routine] = self.hooked.get(routine, 0) + 1
+            return returned[0], returned[0], returned[1]
+
+        return run
+
+    @property
+    def estimated_skipped(self) -> int:
+        return sum(
+            calls * (routine.cycles - 1) for routine, calls in self.hooked.items()
+        )
+
+    def snapshot(self) -> Snapshot:
+        return Snapshot(
+            rom_digest(self.ROM),
+            self.cycle,
+            self.PC,
+            self.A,
+            self.D,
+            self.halted,
+            self.RAM.to_bytes(),
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        if snapshot.rom != rom_digest(self.ROM):
+            raise ValueError("Snapshot is of a different ROM")
+        self.RAM.words[:] = Memory.from_bytes(snapshot.RAM).words
+        self.A = snapshot.A
+        self.D = snapshot.D
+        self.PC = snapshot.PC
+        self.cycle = snapshot.cycle
+        self.halted = snapshot.halted
+        self.loop_states.clear()
+
+    def save_snapshot(self, file: str) -> None:
+        Path(file).write_bytes(self.snapshot().to_bytes())
+
+    def resume_from(self, file: str) -> None:
+        self.restore(Snapshot.from_bytes(Path(file).read_bytes()))
+
+    @contextmanager
+    def sharing(self, name: str | None = None) -> Iterator[SharedRAM]:
+        shared: SharedRAM = SharedRAM.create(name)
+        shared.words[:] = self.RAM.words
+        self.RAM = shared.memory()
+        try:
+            yield shared
+        finally:
+            self.RAM = Memory(array("h", shared.words))
+            shared.close()
+
+    def skip_loop(
+        self, header: int, a: int, d: int, budget: int
+    ) -> tuple[int, int, int]:
+        if self.loop_misses.get(header, 0) >= ATTEMPTS:
+            return a, d, 0
+        skipped: tuple[int, int, int] | None = skip_iterations(
+            self.program, header, a, d, self.RAM.words, budget
+        )
+        if skipped is None or 0 < skipped[2] < MIN_SKIP:
+            self.loop_misses[header] = self.loop_misses.get(header, 0) + 1
+        return skipped or (a, d, 0)
+
+    def settled(self, end: int, d: int, cycle: int) -> bool:
+        loop: Loop = self.loops[end]
+        ram: array[int] = self.RAM.words
+        state: tuple[int, ...] = (d, *(ram[address] for address in loop.addresses))
+        previous: tuple[int, tuple[int, ...]] | None = self.loop_states.get(end)
+        self.loop_states[end] = (cycle, state)
+        return previous == (cycle - loop.length, state)
+
+    @classmethod
+    def load_from(
+        cls,
+        file: str,
+        cycles: int,
+        jit: bool = False,
+        cached: bool = False,
+        profile: bool = False,
+        hooks: bool = False,
+        heatmap: bool = False,
+    ) -> Self:
+        executor: Self = cls.load_program(file, cycles, jit, cached)
+        if profile:
+            executor.profile = Profile.create(len(executor.program))
+        if heatmap:
+            executor.heatmap = Heatmap.create()
+        if hooks and Path(file).suffix == ".asm":
+            executor.install_hooks(
+                SourceMap.from_assembly(File(Path(file)).load()).labels
+            )
+        return executor
 
     @classmethod
-    def load_from(cls, file: str, cycles: int) -> Self:
-        file_path: Path = Path(file)
-        txt: str = read_file(file)
-        txt = txt.replace("\t", "")
-        res: list[str] = txt.split("\n")
-        if file_path.suffix == ".asm":
-            assembler: Assembler = Assembler.create()
-            res = list(assembler.assemble(res))
-        return cls(file, res, cycles, RAM={0: 256})
-
-    def dump_json(self) -> None:
+    def load_program(cls, file: str, cycles: int, jit: bool, cached: bool) -> Self:
+        if not cached:
+            rom: Sequence[str] = load_rom(Path(file))
+            return cls(file, rom, cycles, RAM=Memory.create({0: 256}), jit=jit)
+        compiled: CompiledProgram = CompiledProgram.load_from(file)
+        executor = cls(
+            file,
+            compiled.rom,
+            cycles,
+            RAM=Memory.create({0: 256}),
+            jit=True,
+            analysis=compiled.analysis,
+        )
+        executor.compiler = compiled.compiler(executor.program)
+        return executor
+
+    def dump_json(self, ranges: Iterable[range] | None = None) -> None:
         file_path: Path = Path(self.current_file)
         new_path: Path = file_path.with_suffix(".json")
         with open(new_path, "w") as json_file:
-            json.dump(self.RAM, json_file, indent=4)
+            json.dump(self.RAM.dump(ranges), json_file, indent=4)
+
+    def source(self) -> SourceMap:
+        return source_map(self.current_file)
+
+    def dump_profile(self) -> Path:
+        assert self.profile is not None, "Profiling was not enabled"
+        new_path: Path = Path(self.current_file).with_suffix(".prof")
+        File(new_path).save(render_report(self.profile, self.program, self.source()))
+        return new_path
+
+    def dump_heatmap(self) -> Path:
+        assert self.heatmap is not None, "RAM access counting was not enabled"
+        new_path: Path = Path(self.current_file).with_suffix(".heat")
+        File(new_path).save(render_heatmap(self.heatmap))
+        return new_path
+
+    def dump_binary(self, ranges: Iterable[range] | None = None) -> None:
+        file_path: Path = Path(self.current_file)
+        new_path: Path = file_path.with_suffix(".ram")
+        new_path.write_bytes(self.RAM.to_bytes(ranges))
 
 
-def read_file(file: str) -> str:
-    with open(file, "r", newline=None) as f1:
-        return f1.read()
+def source_map(file: str) -> SourceMap:
+    file_path: Path = Path(file)
+    if file_path.suffix != ".asm":
+        return SourceMap()
+    return SourceMap.from_assembly(File(file_path).load())
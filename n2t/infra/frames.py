@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from n2t.core.executor.keyboard import KeyEvent
+from n2t.core.executor.memory import KBD, SCREEN
+from n2t.core.executor.screen import MAGIC, ScreenTracker, encode_frame, render_pbm
+from n2t.infra.executor import Executor
+
+
+@dataclass
+class FrameCapture:
+    path: Path
+    pbm: bool = False
+    tracker: ScreenTracker = field(default_factory=ScreenTracker)
+    stream: bytearray = field(default_factory=lambda: bytearray(MAGIC))
+    frames: int = 0
+
+    @classmethod
+    def create(cls, path: str, pbm: bool = False) -> FrameCapture:
+        capture = cls(Path(path), pbm)
+        if pbm:
+            capture.path.mkdir(parents=True, exist_ok=True)
+        return capture
+
+    def capture(self, cycle: int, ram: Sequence[int]) -> bool:
+        rows: list[tuple[int, bytes]] = self.tracker.changes(ram[SCREEN:KBD])
+        if not rows:
+            return False
+        if self.pbm:
+            frame: Path = self.path.joinpath(f"frame_{self.frames:05}.pbm")
+            frame.write_bytes(render_pbm(ram[SCREEN:KBD]))
+        else:
+            self.stream += encode_frame(cycle, rows)
+        self.frames += 1
+        return True
+
+    def record(
+        self, executor: Executor, interval: int, events: Iterable[KeyEvent] = ()
+    ) -> int:
+        for cycle in executor.steps(interval, events):
+            self.capture(cycle, executor.RAM.words)
+        if not self.pbm:
+            self.path.write_bytes(self.stream)
+        return self.frames
@@ -6,6 +6,7 @@ from typing import Iterable, Iterator, Protocol
 
 from n2t.core import Disassembler as DefaultDisassembler
 from n2t.infra.io import File, FileFormat
+from n2t.infra.rom import PackedRom
 
 
 @dataclass
@@ -14,7 +15,7 @@ class HackProgram:
     disassembler: Disassembler = field(default_factory=DefaultDisassembler.create)
 
     def __post_init__(self) -> None:
-        FileFormat.hack.validate(self.path)
+        FileFormat.expect(self.path, FileFormat.hack, FileFormat.packed)
 
     @classmethod
     def load_from(cls, file_name: str) -> HackProgram:
@@ -25,7 +26,10 @@ class HackProgram:
         assembly_file.save(self.disassembler.disassemble(self))
 
     def __iter__(self) -> Iterator[str]:
-        yield from File(self.path).load()
+        if self.path.suffix == FileFormat.packed.value:
+            yield from PackedRom.load(self.path)
+        else:
+            yield from File(self.path).load()
 
 
 class Disassembler(Protocol):  # pragma: no cover
@@ -10,10 +10,19 @@ from typing import Iterable
 
 class FileFormat(Enum):
     hack = ".hack"
+    packed = ".hackb"
     asm = ".asm"
 
     def validate(self, path: Path) -> None:
-        assert path.suffix == self.value
+        FileFormat.expect(path, self)
+
+    @classmethod
+    def expect(cls, path: Path, *formats: FileFormat) -> FileFormat:
+        for candidate in formats:
+            if path.suffix == candidate.value:
+                return candidate
+        expected: str = " or ".join(candidate.value for candidate in formats)
+        raise ValueError(f"Expected a {expected} file, got {path}")
 
     def convert(self, path: Path) -> Path:
         return path.with_suffix(self.value)
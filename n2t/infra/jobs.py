@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+from n2t.core.executor import BlockCompiler, Memory
+from n2t.core.executor.analysis import Analysis
+from n2t.core.executor.keyboard import KeyEvent, parse_script
+from n2t.infra.executor import Executor
+from n2t.infra.rom import load_rom
+
+_ROMS: dict[str, Sequence[str]] = {}
+_LOADED: dict[str, tuple[Analysis, BlockCompiler]] = {}
+
+
+@dataclass(frozen=True)
+class Job:
+    index: int
+    program: str
+    cycles: int = -1
+    ram: dict[int, int] = field(default_factory=lambda: {0: 256})
+    keys: tuple[KeyEvent, ...] = ()
+
+    @classmethod
+    def from_json(cls, index: int, line: str, directory: Path) -> Job:
+        job: dict[str, Any] = json.loads(line)
+        ram: dict[str, int] = job.get("ram", {"0": 256})
+        return cls(
+            index,
+            str(directory.joinpath(job["program"])),
+            job.get("cycles", -1),
+            {int(address): value for address, value in ram.items()},
+            tuple(parse_script(job.get("keys", []))),
+        )
+
+
+def load_manifest(manifest: str) -> list[Job]:
+    path: Path = Path(manifest)
+    with open(path, "r") as lines:
+        return [
+            Job.from_json(index, line, path.parent)
+            for index, line in enumerate(line for line in lines if line.strip())
+        ]
+
+
+def run_jobs(
+    jobs: Iterable[Job], workers: int | None = None, jit: bool = False
+) -> Iterator[dict[str, Any]]:
+    jobs = list(jobs)
+    programs: set[str] = {job.program for job in jobs}
+    roms: dict[str, Sequence[str]] = {
+        program: load_rom(Path(program)) for program in programs
+    }
+    with ProcessPoolExecutor(workers, initializer=share, initargs=(roms,)) as pool:
+        futures: list[Future[dict[str, Any]]] = [
+            pool.submit(run_job, job, jit) for job in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def share(roms: dict[str, Sequence[str]]) -> None:
+    _ROMS.update(roms)
+
+
+def run_job(job: Job, jit: bool) -> dict[str, Any]:
+    if job.program not in _LOADED:
+        loaded: Executor = Executor(job.program, _ROMS[job.program], 0)
+        assert loaded.analysis is not None
+        _LOADED[job.program] = (loaded.analysis, loaded.compiler)
+    analysis, compiler = _LOADED[job.program]
+    executor = Executor(
+        job.program,
+        _ROMS[job.program],
+        job.cycles,
+        Memory.create(job.ram),
+        jit=jit,
+        analysis=analysis,
+    )
+    executor.compiler = compiler
+    executor.play(job.keys)
+    return {
+        "job": job.index,
+        "program": job.program,
+        "A": executor.A,
+        "D": executor.D,
+        "PC": executor.PC,
+        "RAM": executor.RAM.dump(),
+    }
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import mmap
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from n2t.core import Assembler
+from n2t.core.executor import Instruction, decode, decode_words
+from n2t.infra.io import File, FileFormat
+
+
+@dataclass(frozen=True)
+class PackedRom(Sequence[str]):
+    words: memoryview
+
+    @classmethod
+    def load(cls, path: Path) -> PackedRom:
+        if sys.byteorder != "little" or not path.stat().st_size:
+            return cls.from_bytes(path.read_bytes())
+        with path.open("rb") as file:
+            data: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(data).cast("H"))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PackedRom:
+        assert len(data) % 2 == 0, "Packed ROM must hold whole 16-bit words"
+        words: array[int] = array("H", data)
+        if sys.byteorder != "little":
+            words.byteswap()
+        return cls(memoryview(words))
+
+    def to_bytes(self) -> bytes:
+        return pack(self.words)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [f"{word:016b}" for word in self.words[index]]
+        return f"{self.words[index]:016b}"
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"{word:016b}" for word in self.words)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return PackedRom.from_bytes, (self.to_bytes(),)
+
+
+def pack(words: Iterable[int]) -> bytes:
+    packed: array[int] = array("H", words)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def pack_text(lines: Iterable[str]) -> bytes:
+    return pack(int(line, 2) for line in lines if line)
+
+
+def load_rom(path: Path) -> Sequence[str]:
+    if path.suffix == FileFormat.packed.value:
+        return PackedRom.load(path)
+    return parse_rom(path.read_text(), path.suffix)
+
+
+def read_rom(source: bytes, suffix: str) -> Sequence[str]:
+    if suffix == FileFormat.packed.value:
+        return PackedRom.from_bytes(source)
+    return parse_rom(source.decode(), suffix)
+
+
+def parse_rom(text: str, suffix: str) -> list[str]:
+    text = text.replace("\t", "")
+    lines: list[str] = [line.strip() for line in text.splitlines() if line.strip()]
+    if suffix == ".asm":
+        lines = list(Assembler.create().assemble(lines))
+    return lines
+
+
+def decode_rom(rom: Sequence[str]) -> list[Instruction]:
+    if isinstance(rom, PackedRom):
+        return decode_words(rom.words)
+    return decode(rom)
+
+
+def convert_rom(path: Path) -> Path:
+    if path.suffix == FileFormat.packed.value:
+        target: Path = FileFormat.hack.convert(path)
+        File(target).save(PackedRom.load(path))
+    else:
+        FileFormat.hack.validate(path)
+        target = FileFormat.packed.convert(path)
+        target.write_bytes(pack_text(File(path).load()))
+    return target
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+from array import array
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import cast
+
+from n2t.core.executor import Memory
+from n2t.core.executor.memory import KBD, RAM_SIZE, SCREEN
+
+# The segment holds nothing but the 32K RAM words as native-endian int16,
+# so address n lives at byte 2 * n: SCREEN at bytes 32768-49151 and KBD at
+# bytes 49152-49153.
+WORD_SIZE = 2
+SEGMENT_SIZE = WORD_SIZE * RAM_SIZE
+
+_CREATED: set[str] = set()
+
+
+def words_of(segment: SharedMemory) -> memoryview:
+    assert segment.buf is not None, "Segment is closed"
+    return segment.buf[:SEGMENT_SIZE].cast("h")
+
+
+@dataclass
+class SharedRAM:
+    segment: SharedMemory
+    words: memoryview
+    owner: bool = False
+
+    @classmethod
+    def create(cls, name: str | None = None) -> SharedRAM:
+        segment = SharedMemory(name, create=True, size=SEGMENT_SIZE)
+        _CREATED.add(segment.name)
+        return cls(segment, words_of(segment), owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedRAM:
+        segment = SharedMemory(name)
+        if os.name == "posix" and segment.name not in _CREATED:
+            resource_tracker.unregister(f"/{segment.name}", "shared_memory")
+        assert segment.size >= SEGMENT_SIZE, "Segment is too small to hold RAM"
+        return cls(segment, words_of(segment))
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    def memory(self) -> Memory:
+        # memoryview supports every indexing and slicing operation the
+        # executors perform on the RAM array, so it can stand in for one.
+        return Memory(cast("array[int]", self.words))
+
+    def screen(self) -> memoryview:
+        return self.words[SCREEN:KBD]
+
+    def press(self, key: int) -> None:
+        self.words[KBD] = key
+
+    def close(self) -> None:
+        self.words.release()
+        self.segment.close()
+        if self.owner:
+            _CREATED.discard(self.segment.name)
+            self.segment.unlink()
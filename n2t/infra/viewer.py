@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from n2t.core.executor.screen import render_ppm
+from n2t.infra.shared import SharedRAM
+
+
+@dataclass
+class ScreenViewer:
+    shared: SharedRAM
+    directory: Path
+    written: int = 0
+    last: bytes = b""
+
+    @classmethod
+    def attach(cls, name: str, directory: str) -> ScreenViewer:
+        path: Path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        return cls(SharedRAM.attach(name), path)
+
+    def capture(self) -> Path | None:
+        with self.shared.screen() as screen:
+            frame: bytes = render_ppm(screen)
+        if frame == self.last:
+            return None
+        self.last = frame
+        path: Path = self.directory.joinpath(f"frame_{self.written:05}.ppm")
+        path.write_bytes(frame)
+        self.written += 1
+        return path
+
+    def watch(self, frames: int, interval: float) -> int:
+        while frames < 0 or self.written < frames:
+            self.capture()
+            time.sleep(interval)
+        return self.written
+
+    def close(self) -> None:
+        self.shared.close()
@@ -368,9 +368,3 @@ class VmProgram:  # TODO: your work for Projects 7 and 8 starts here
         self.pop(result)
         result.append("D=-M")
         self.push(result)
-
-
-prog = VmProgram.load_from(
-    r"C:\Users\PC\Desktop\nand2tetris\projects\7\StackArithmetic\StackTest\StackTest.vm"
-)
-prog.translate()
@@ -1,7 +1,22 @@
+import json
+from contextlib import nullcontext
+from pathlib import Path
+from typing import ContextManager
+
 import typer
 from typer import Typer, echo
 
+from n2t.core.assembler.facade import PARALLEL_THRESHOLD
+from n2t.core.executor.history import History
+from n2t.core.executor.keyboard import KeyEvent, parse_script
+from n2t.core.executor.watch import Watches
 from n2t.infra import AsmProgram, Executor, HackProgram, JackProgram, VmProgram
+from n2t.infra.executor import source_map
+from n2t.infra.frames import FrameCapture
+from n2t.infra.io import File
+from n2t.infra.jobs import load_manifest, run_jobs
+from n2t.infra.rom import convert_rom
+from n2t.infra.viewer import ScreenViewer
 
 cli = Typer(
     name="Nand 2 Tetris Software",
@@ -18,12 +33,26 @@ def run_disassembler(hack_file: str) -> None:
 
 
 @cli.command("assemble", no_args_is_help=True)
-def run_assembler(assembly_file: str) -> None:
+def run_assembler(
+    assembly_file: str,
+    stream: bool = typer.Option(False, "--stream"),
+    threshold: int = typer.Option(PARALLEL_THRESHOLD, "--parallel-threshold"),
+    workers: int = typer.Option(0, "--workers", "-w"),
+    packed: bool = typer.Option(False, "--packed"),
+) -> None:
     echo(f"Assembling {assembly_file}")
-    AsmProgram.load_from(assembly_file).assemble()
+    AsmProgram.load_from(
+        assembly_file, stream, threshold, workers or None, packed
+    ).assemble()
     echo("Done!")
 
 
+@cli.command("convert", no_args_is_help=True)
+def run_converter(hack_file: str) -> None:
+    echo(f"Converting {hack_file}")
+    echo(f"Wrote {convert_rom(Path(hack_file))}")
+
+
 @cli.command("translate_vm", no_args_is_help=True)
 def run_vm_translator(vm_file_or_directory: str) -> None:
     echo(f"Translating {vm_file_or_directory}")
@@ -38,10 +67,198 @@ def run_compiler(jack_file_or_directory: str) -> None:
     echo("Done!")
 
 
+def parse_range(text: str) -> range:
+    start, _, stop = text.partition(":")
+    if not start.isdigit() or not (stop.isdigit() or not stop):
+        raise typer.BadParameter(f"Expected ADDRESS or START:STOP, got {text!r}")
+    return range(int(start), int(stop) if stop else int(start) + 1)
+
+
 @cli.command("execute", no_args_is_help=True)
-def run_execution(file: str, cycles: int = typer.Option(-1, "--cycles", "-c")) -> None:
+def run_execution(
+    file: str,
+    cycles: int = typer.Option(-1, "--cycles", "-c"),
+    dump_ranges: list[range] = typer.Option(
+        [], "--dump-range", "-r", parser=parse_range
+    ),
+    binary: bool = typer.Option(False, "--binary"),
+    jit: bool = typer.Option(False, "--jit"),
+    cached: bool = typer.Option(False, "--cached"),
+    profile: bool = typer.Option(False, "--profile"),
+    resume: str = typer.Option("", "--resume"),
+    snapshot: str = typer.Option("", "--snapshot"),
+    hooks: bool = typer.Option(
+        False,
+        "--os-hooks",
+        help="Run known OS routines natively. Each hooked call counts as one "
+        "cycle, so --cycles and reported cycles are no longer emulated cycles.",
+    ),
+    shared_memory: str = typer.Option("", "--shared-memory"),
+    capture: str = typer.Option("", "--capture"),
+    capture_every: int = typer.Option(100_000, "--capture-every"),
+    pbm: bool = typer.Option(False, "--pbm"),
+    keys: str = typer.Option("", "--keys"),
+    breakpoints: list[str] = typer.Option([], "--break", "-b"),
+    watch_reads: list[int] = typer.Option([], "--watch-read"),
+    watch_writes: list[int] = typer.Option([], "--watch-write"),
+    stop_when: list[str] = typer.Option([], "--stop-when"),
+    heatmap: bool = typer.Option(False, "--heatmap"),
+    back: int = typer.Option(0, "--back", min=0),
+    history_interval: int = typer.Option(10_000, "--history-interval", min=1),
+    history_budget: int = typer.Option(16 << 20, "--history-budget"),
+) -> None:
+    check_exclusive(
+        {
+            "--profile": profile,
+            "--break/--watch-read/--watch-write/--stop-when": bool(
+                breakpoints or watch_reads or watch_writes or stop_when
+            ),
+            "--heatmap": heatmap,
+            "--back": back > 0,
+        }
+    )
+    if back and not resume and 0 <= cycles < back:
+        raise typer.BadParameter(
+            f"cannot step back {back} cycles from a {cycles}-cycle run",
+            param_hint="--back",
+        )
+    watches: Watches | None = None
+    if breakpoints or watch_reads or watch_writes or stop_when:
+        watches = parse_watches(file, breakpoints, watch_reads, watch_writes, stop_when)
     echo(f"Executing {file}")
-    executor: Executor = Executor.load_from(file, cycles)
-    executor.compile()
-    executor.dump_json()
+    executor: Executor = Executor.load_from(
+        file, cycles, jit, cached, profile, hooks, heatmap
+    )
+    executor.watches = watches
+    if resume:
+        try:
+            executor.resume_from(resume)
+        except (OSError, ValueError) as error:
+            echo(f"Cannot resume from {resume}: {error}")
+            raise typer.Exit(1)
+    sharing: ContextManager[object] = nullcontext()
+    if shared_memory:
+        sharing = executor.sharing(shared_memory)
+        echo(f"Sharing RAM as {shared_memory}")
+    if back:
+        executor.history = History.create(history_interval, history_budget)
+    events: list[KeyEvent] = parse_script(File(Path(keys)).load()) if keys else []
+    with sharing:
+        if capture:
+            frames: FrameCapture = FrameCapture.create(capture, pbm)
+            frames.record(executor, capture_every, events)
+            echo(f"Captured {frames.frames} frames to {capture}")
+        elif events:
+            executor.play(events)
+        else:
+            executor.compile()
+    if back:
+        try:
+            executor.step_back(back)
+        except ValueError as error:
+            echo(f"Cannot step back: {error}")
+            raise typer.Exit(1)
+        echo(f"Stepped back to cycle {executor.cycle}")
+    if snapshot:
+        executor.save_snapshot(snapshot)
+    if profile:
+        echo(f"Profile written to {executor.dump_profile()}")
+    if executor.heatmap is not None:
+        echo(f"Max SP {executor.heatmap.max_sp}, heap top {executor.heatmap.heap_top}")
+        echo(f"RAM heatmap written to {executor.dump_heatmap()}")
+    if executor.hit is not None:
+        echo(executor.hit.describe())
+        echo(f"A={executor.A} D={executor.D} PC={executor.PC}")
+    if executor.hooked:
+        calls: int = sum(executor.hooked.values())
+        echo(
+            f"Hooked {calls} OS calls counted as one cycle each, "
+            f"skipping an estimated {executor.estimated_skipped} emulated cycles"
+        )
+    if executor.halted:
+        echo(f"Halted after {executor.cycle} cycles")
+    if binary:
+        executor.dump_binary(dump_ranges or None)
+    else:
+        executor.dump_json(dump_ranges or None)
+    echo("Done!")
+
+
+@cli.command("view", no_args_is_help=True)
+def run_viewer(
+    shared_memory: str,
+    output: str = typer.Option("frames", "--output", "-o"),
+    frames: int = typer.Option(-1, "--frames", "-f"),
+    interval: float = typer.Option(0.1, "--interval", "-i"),
+) -> None:
+    echo(f"Watching the screen of {shared_memory}")
+    viewer: ScreenViewer = ScreenViewer.attach(shared_memory, output)
+    try:
+        viewer.watch(frames, interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        viewer.close()
+    echo(f"Wrote {viewer.written} frames to {output}")
+
+
+@cli.command("execute_batch", no_args_is_help=True)
+def run_batch_execution(
+    file: str, inputs: str, cycles: int = typer.Option(-1, "--cycles", "-c")
+) -> None:
+    try:
+        from n2t.infra.batch import BatchProgram
+    except ImportError:
+        echo("Batch execution needs numpy, install the 'batch' extra")
+        raise typer.Exit(1)
+    echo(f"Executing {file} for every RAM in {inputs}")
+    program: BatchProgram = BatchProgram.load_from(file, inputs, cycles)
+    program.execute()
+    program.dump_json()
     echo("Done!")
+
+
+@cli.command("execute_manifest", no_args_is_help=True)
+def run_manifest_execution(
+    manifest: str,
+    workers: int = typer.Option(0, "--workers", "-w"),
+    jit: bool = typer.Option(False, "--jit"),
+) -> None:
+    for result in run_jobs(load_manifest(manifest), workers or None, jit):
+        echo(json.dumps(result))
+
+
+def check_exclusive(modes: dict[str, bool]) -> None:
+    chosen: list[str] = [flag for flag, enabled in modes.items() if enabled]
+    if len(chosen) > 1:
+        echo(f"{' and '.join(chosen)} each need their own run, pick one")
+        raise typer.Exit(1)
+
+
+def parse_watches(
+    file: str,
+    breakpoints: list[str],
+    reads: list[int],
+    writes: list[int],
+    predicates: list[str],
+) -> Watches:
+    labels: dict[str, int] = {
+        label.lower(): address for address, label in source_map(file).labels
+    }
+    try:
+        return Watches.create(
+            [parse_breakpoint(text, labels) for text in breakpoints],
+            reads,
+            writes,
+            predicates,
+        )
+    except ValueError as error:
+        raise typer.BadParameter(str(error))
+
+
+def parse_breakpoint(text: str, labels: dict[str, int]) -> int:
+    if text.isdigit():
+        return int(text)
+    if text.lower() not in labels:
+        raise ValueError(f"Unknown breakpoint label {text!r}")
+    return labels[text.lower()]
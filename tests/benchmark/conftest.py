@@ -0,0 +1,63 @@
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+from tests.benchmark.workloads import (
+    SYNTHETIC,
+    Measurement,
+    save_baselines,
+)
+
+_RESULTS: dict[str, Measurement] = {}
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with --benchmark")
+    for item in items:
+        if Path(item.path).parent == Path(__file__).parent:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    if not _RESULTS:
+        return
+    terminalreporter.section("executor benchmarks")
+    terminalreporter.write_line(
+        f"{'workload':<20}{'cycles':>12}{'ips':>14}{'relative':>10}"
+        f"{'load ms':>10}{'peak KiB':>10}"
+    )
+    for name, result in sorted(_RESULTS.items()):
+        terminalreporter.write_line(
+            f"{name:<20}{result.cycles:>12}{result.ips:>14,.0f}"
+            f"{result.relative:>10.3f}{result.load_seconds * 1000:>10.1f}"
+            f"{result.peak_bytes / 1024:>10.0f}"
+        )
+    if config.getoption("--benchmark-save"):
+        save_baselines(_RESULTS)
+
+
+@pytest.fixture(scope="session")
+def results() -> dict[str, Measurement]:
+    return _RESULTS
+
+
+@pytest.fixture(scope="session")
+def threshold(pytestconfig: pytest.Config) -> float:
+    value: float = pytestconfig.getoption("--benchmark-threshold")
+    return value
+
+
+@pytest.fixture(scope="session")
+def synthetic_directory(tmp_path_factory: pytest.TempPathFactory) -> Iterable[Path]:
+    directory: Path = tmp_path_factory.mktemp("synthetic")
+    for name, program in SYNTHETIC.items():
+        directory.joinpath(f"{name}.asm").write_text("\n".join(program) + "\n")
+
+    yield directory
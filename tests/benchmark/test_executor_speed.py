@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from tests.benchmark.workloads import (
+    GATED_CYCLES,
+    Measurement,
+    Workload,
+    load_baselines,
+    measure,
+)
+
+_WORKLOADS = [
+    Workload("rect", "rect.asm", -1),
+    Workload("pong", "pong.asm", 2_000_000),
+    Workload("checksum", "checksum.asm", 2_000_000),
+    Workload("stack", "stack.asm", 2_000_000),
+]
+
+
+@pytest.fixture(scope="module")
+def asm_directory(pytestconfig: pytest.Config) -> Path:
+    return pytestconfig.rootpath.joinpath("tests", "e2e", "asm")
+
+
+@pytest.mark.parametrize("jit", [False, True], ids=["interpreter", "jit"])
+@pytest.mark.parametrize("workload", _WORKLOADS, ids=[w.name for w in _WORKLOADS])
+def test_executor_should_keep_throughput(
+    workload: Workload,
+    jit: bool,
+    asm_directory: Path,
+    synthetic_directory: Path,
+    results: dict[str, Measurement],
+    threshold: float,
+) -> None:
+    program: Path = asm_directory.joinpath(workload.program)
+    if not program.exists():
+        program = synthetic_directory.joinpath(workload.program)
+    name: str = f"{workload.name}-{'jit' if jit else 'interpreter'}"
+
+    result: Measurement = measure(program, workload.cycles, jit)
+    results[name] = result
+
+    baseline: dict[str, float] | None = load_baselines().get(name)
+    if baseline is None or result.cycles < GATED_CYCLES:
+        return
+    assert result.relative >= baseline["relative"] * (1 - threshold), (
+        f"{name} ran at {result.relative:.3f}x the calibration loop "
+        f"({result.ips:,.0f} ips), below {1 - threshold:.0%} of the "
+        f"{baseline['relative']:.3f}x baseline"
+    )
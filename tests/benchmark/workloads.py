@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple
+
+from n2t.core.executor.snapshot import Snapshot
+from n2t.infra import Executor
+
+BASELINES = Path(__file__).with_name("baselines.json")
+GATED_CYCLES = 100_000
+REPEAT_CYCLES = 2_000_000
+MEMORY_CYCLES = 100_000
+CALIBRATION_ROUNDS = 200_000
+CALIBRATION_REPEATS = 3
+MEASURE_REPEATS = 3
+
+CHECKSUM = [
+    "(RESET)",
+    "@30000",
+    "D=A",
+    "@R0",
+    "M=D",
+    "(LOOP)",
+    "@R0",
+    "D=M",
+    "@R1",
+    "M=D&M",
+    "D=M",
+    "@R2",
+    "M=D|M",
+    "@R3",
+    "M=!M",
+    "@R0",
+    "MD=M-1",
+    "@LOOP",
+    "D;JGT",
+    "@RESET",
+    "0;JMP",
+]
+
+STACK = [
+    "@256",
+    "D=A",
+    "@SP",
+    "M=D",
+    "(LOOP)",
+    "@R6",
+    "D=M",
+    "@SP",
+    "AM=M+1",
+    "A=A-1",
+    "M=D",
+    "@SP",
+    "AM=M-1",
+    "D=M",
+    "@R5",
+    "M=D|M",
+    "@SP",
+    "AM=M-1",
+    "D=M",
+    "A=A-1",
+    "M=D+M",
+    "@SP",
+    "M=M+1",
+    "@R6",
+    "M=M+1",
+    "@LOOP",
+    "0;JMP",
+]
+
+SYNTHETIC: dict[str, list[str]] = {"checksum": CHECKSUM, "stack": STACK}
+
+
+class Workload(NamedTuple):
+    name: str
+    program: str
+    cycles: int
+
+
+@dataclass(frozen=True)
+class Measurement:
+    cycles: int
+    load_seconds: float
+    run_seconds: float
+    peak_bytes: int
+    calibration: float
+
+    @property
+    def ips(self) -> float:
+        return self.cycles / self.run_seconds if self.run_seconds else 0.0
+
+    @property
+    def relative(self) -> float:
+        return self.ips / self.calibration
+
+    def to_json(self) -> dict[str, float]:
+        return {
+            "relative": round(self.relative, 4),
+            "ips": round(self.ips),
+            **{key: round(value, 6) for key, value in asdict(self).items()},
+        }
+
+
+def calibrate(
+    rounds: int = CALIBRATION_ROUNDS, repeats: int = CALIBRATION_REPEATS
+) -> float:
+    fastest: float = float("inf")
+    for _ in range(repeats):
+        started: float = perf_counter()
+        calibration_loop(rounds)
+        fastest = min(fastest, perf_counter() - started)
+    return rounds / fastest
+
+
+def calibration_loop(rounds: int) -> int:
+    program: list[tuple[int, int, int]] = [
+        (index & 3, index * 7, index % 16) for index in range(64)
+    ]
+    ram: list[int] = [0] * 16
+    d: int = 0
+    pc: int = 0
+    for _ in range(rounds):
+        kind, value, address = program[pc]
+        if kind == 0:
+            d = (d + value) & 0xFFFF
+        elif kind == 1:
+            ram[address] = d
+        else:
+            d ^= ram[address]
+        pc = (pc + 1) & 63
+    return d
+
+
+def measure(
+    program: Path, cycles: int, jit: bool, repeats: int = MEASURE_REPEATS
+) -> Measurement:
+    peak: int = peak_memory(program, cycles, jit)
+    return max(
+        (measure_once(program, cycles, jit, peak) for _ in range(repeats)),
+        key=lambda measurement: measurement.relative,
+    )
+
+
+def measure_once(program: Path, cycles: int, jit: bool, peak: int) -> Measurement:
+    calibration: float = calibrate()
+    started: float = perf_counter()
+    executor: Executor = Executor.load_from(str(program), cycles, jit)
+    loaded: float = perf_counter()
+    start: Snapshot = executor.snapshot()
+    total: int = 0
+    seconds: float = 0.0
+    while True:
+        began: float = perf_counter()
+        executor.compile()
+        seconds += perf_counter() - began
+        total += executor.cycle - start.cycle
+        if total >= REPEAT_CYCLES or not executor.halted:
+            break
+        executor.restore(start)
+    return Measurement(total, loaded - started, seconds, peak, calibration)
+
+
+def peak_memory(program: Path, cycles: int, jit: bool) -> int:
+    tracemalloc.start()
+    try:
+        limit: int = MEMORY_CYCLES if cycles < 0 else min(cycles, MEMORY_CYCLES)
+        Executor.load_from(str(program), limit, jit).compile()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def load_baselines(path: Path = BASELINES) -> dict[str, dict[str, float]]:
+    if not path.exists():
+        return {}
+    baselines: dict[str, dict[str, float]] = json.loads(path.read_text())
+    return baselines
+
+
+def save_baselines(results: dict[str, Measurement], path: Path = BASELINES) -> None:
+    baselines: dict[str, dict[str, float]] = {
+        name: result.to_json() for name, result in sorted(results.items())
+    }
+    path.write_text(json.dumps(baselines, indent=4) + "\n")
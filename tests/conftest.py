@@ -1,8 +1,29 @@
 import os
 
+import pytest
 from hypothesis import settings
 
 settings.register_profile("easy", max_examples=5)
 settings.register_profile("mild", max_examples=50)
 settings.register_profile("hard", max_examples=500)
 settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the executor benchmarks under tests/benchmark",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed fractional drop in calibrated throughput (default 0.25)",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="Overwrite tests/benchmark/baselines.json with this run",
+    )
@@ -13,6 +13,7 @@ def hack_directory(pytestconfig: pytest.Config) -> Iterable[Path]:
     yield name
 
     remove_files(pattern=str(name.joinpath("*.asm")))
+    remove_files(pattern=str(name.joinpath("*.hackb")))
 
 
 @pytest.fixture(scope="module")
@@ -22,3 +23,4 @@ def asm_directory(pytestconfig: pytest.Config) -> Iterable[Path]:
     yield name
 
     remove_files(pattern=str(name.joinpath("*.hack")))
+    remove_files(pattern=str(name.joinpath("*.hackb")))
@@ -3,17 +3,41 @@ from pathlib import Path
 
 import pytest
 
-from n2t.runner.cli import run_assembler
+from n2t.core.assembler.facade import PARALLEL_THRESHOLD
+from n2t.runner.cli import run_assembler, run_converter
 
 _TEST_PROGRAMS = ["empty", "addL", "maxL", "rectL", "pongL", "max", "rect", "pong"]
 
 
 # @pytest.mark.skip
+@pytest.mark.parametrize(
+    "stream, threshold",
+    [(False, PARALLEL_THRESHOLD), (True, PARALLEL_THRESHOLD), (False, 0)],
+    ids=["list", "stream", "parallel"],
+)
 @pytest.mark.parametrize("program", _TEST_PROGRAMS)
-def test_should_assemble(program: str, asm_directory: Path) -> None:
+def test_should_assemble(
+    program: str, stream: bool, threshold: int, asm_directory: Path
+) -> None:
     asm_file = str(asm_directory.joinpath(f"{program}.asm"))
 
-    run_assembler(asm_file)
+    run_assembler(asm_file, stream, threshold, 2, False)
+
+    assert filecmp.cmp(
+        shallow=False,
+        f1=str(asm_directory.joinpath(f"{program}.cmp")),
+        f2=str(asm_directory.joinpath(f"{program}.hack")),
+    )
+
+
+@pytest.mark.parametrize("program", _TEST_PROGRAMS)
+def test_packed_rom_should_round_trip_to_text(
+    program: str, asm_directory: Path
+) -> None:
+    asm_file = str(asm_directory.joinpath(f"{program}.asm"))
+
+    run_assembler(asm_file, False, PARALLEL_THRESHOLD, 0, True)
+    run_converter(str(asm_directory.joinpath(f"{program}.hackb")))
 
     assert filecmp.cmp(
         shallow=False,
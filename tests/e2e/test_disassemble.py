@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from n2t.runner.cli import run_disassembler
+from n2t.runner.cli import run_converter, run_disassembler
 
 _TEST_PROGRAMS = ["empty", "wrong", "add", "max", "rect", "pong"]
 
@@ -19,3 +19,16 @@ def test_should_disassemble(program: str, hack_directory: Path) -> None:
         f1=str(hack_directory.joinpath(f"{program}.cmp")),
         f2=str(hack_directory.joinpath(f"{program}.asm")),
     )
+
+
+@pytest.mark.parametrize("program", ["empty", "add", "max", "rect", "pong"])
+def test_should_disassemble_packed(program: str, hack_directory: Path) -> None:
+    run_converter(str(hack_directory.joinpath(f"{program}.hack")))
+
+    run_disassembler(str(hack_directory.joinpath(f"{program}.hackb")))
+
+    assert filecmp.cmp(
+        shallow=False,
+        f1=str(hack_directory.joinpath(f"{program}.cmp")),
+        f2=str(hack_directory.joinpath(f"{program}.asm")),
+    )
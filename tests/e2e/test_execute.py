@@ -0,0 +1,148 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from n2t.runner.cli import cli
+
+_COUNTER = "@i\nM=M+1\n@0\n0;JMP\n"
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        ["--heatmap", "--profile"],
+        ["--heatmap", "--stop-when", "RAM[16]==5"],
+        ["--profile", "--back", "10"],
+        ["--stop-when", "RAM[16]==5000", "--back", "10"],
+    ],
+)
+def test_should_refuse_to_combine_run_loops(flags: list[str], tmp_path: Path) -> None:
+    program = tmp_path.joinpath("counter.asm")
+    program.write_text(_COUNTER)
+
+    result = CliRunner().invoke(cli, ["execute", str(program), "-c", "100", *flags])
+
+    assert result.exit_code == 1
+    assert "pick one" in result.output
+    assert not program.with_suffix(".heat").exists()
+
+
+def test_should_write_heatmap_for_unmapped_addresses(tmp_path: Path) -> None:
+    program = tmp_path.joinpath("far.asm")
+    program.write_text("@30000\nM=1\n")
+
+    result = CliRunner().invoke(cli, ["execute", str(program), "--heatmap"])
+
+    assert result.exit_code == 0, result.output
+    assert "30000 unmapped" in " ".join(
+        program.with_suffix(".heat").read_text().split()
+    )
+
+
+def test_should_step_back_after_plain_run(tmp_path: Path) -> None:
+    program = tmp_path.joinpath("counter.asm")
+    program.write_text(_COUNTER)
+
+    result = CliRunner().invoke(
+        cli, ["execute", str(program), "-c", "10000", "--back", "10"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Stepped back to cycle 9990" in result.output
+
+
+def test_should_refuse_snapshot_of_another_program(tmp_path: Path) -> None:
+    counter = tmp_path.joinpath("counter.asm")
+    counter.write_text(_COUNTER)
+    other = tmp_path.joinpath("other.asm")
+    other.write_text("@R1\nM=1\n")
+    snapshot = str(tmp_path.joinpath("counter.snap"))
+    CliRunner().invoke(
+        cli, ["execute", str(counter), "-c", "10", "--snapshot", snapshot]
+    )
+
+    result = CliRunner().invoke(cli, ["execute", str(other), "--resume", snapshot])
+
+    assert result.exit_code == 1
+    assert "Snapshot is of a different ROM" in result.output
+    assert not other.with_suffix(".json").exists()
+
+
+@pytest.mark.parametrize(
+    "flags, message",
+    [
+        (["--break", "NOPE"], "Unknown breakpoint label 'NOPE'"),
+        (["--stop-when", "RAM[0] = 3"], "Expected 'RAM[n] op value'"),
+    ],
+)
+def test_should_reject_bad_watches_before_running(
+    flags: list[str], message: str, tmp_path: Path
+) -> None:
+    program = tmp_path.joinpath("counter.asm")
+    program.write_text(_COUNTER)
+
+    result = CliRunner().invoke(cli, ["execute", str(program), *flags])
+
+    assert result.exit_code == 2
+    assert message in result.output
+    assert "Executing" not in result.output
+
+
+@pytest.mark.parametrize(
+    "flags, message",
+    [
+        (["-c", "4000", "--back", "5000"], "cannot step back 5000 cycles"),
+        (["--back", "10", "--history-interval", "0"], "--history-interval"),
+    ],
+)
+def test_should_reject_bad_history_options_before_running(
+    flags: list[str], message: str, tmp_path: Path
+) -> None:
+    program = tmp_path.joinpath("counter.asm")
+    program.write_text(_COUNTER)
+
+    result = CliRunner().invoke(cli, ["execute", str(program), *flags])
+
+    assert result.exit_code == 2
+    assert message in result.output
+    assert "Executing" not in result.output
+
+
+def test_should_report_steps_back_past_history(tmp_path: Path) -> None:
+    program = tmp_path.joinpath("counter.asm")
+    program.write_text(_COUNTER)
+    flags = ["-c", "100000", "--back", "99000", "--history-budget", "1024"]
+
+    result = CliRunner().invoke(cli, ["execute", str(program), *flags])
+
+    assert result.exit_code == 1
+    assert "Cannot step back: Cycle 1000 is no longer in history" in result.output
+
+
+def test_should_reject_bad_dump_range_before_running(tmp_path: Path) -> None:
+    program = tmp_path.joinpath("counter.asm")
+    program.write_text(_COUNTER)
+
+    result = CliRunner().invoke(cli, ["execute", str(program), "-r", "abc"])
+
+    assert result.exit_code == 2
+    assert "Expected ADDRESS or START:STOP" in result.output
+    assert "Executing" not in result.output
+
+
+def test_should_label_hooked_cycles_as_estimates(tmp_path: Path) -> None:
+    program = tmp_path.joinpath("multiply.asm")
+    program.write_text(
+        "@300\nD=A\n@SP\nM=D\n@LCL\nM=D\n@293\nD=A\n@ARG\nM=D\n"
+        "@RET\nD=A\n@295\nM=D\n@Math.multiply\n0;JMP\n"
+        "(RET)\n@RET\n0;JMP\n(Math.multiply)\n@5\n0;JMP\n"
+    )
+
+    result = CliRunner().invoke(
+        cli, ["execute", str(program), "-c", "100", "--os-hooks"]
+    )
+
+    assert result.exit_code == 0
+    assert "Hooked 1 OS calls counted as one cycle each" in result.output
+    assert "an estimated 1459 emulated cycles" in result.output
@@ -0,0 +1,36 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from n2t.core.executor.screen import FrameReader, screen_bytes
+from n2t.infra import Executor
+from n2t.infra.frames import FrameCapture
+
+_FRAMES = [
+    ("rect", -1, 500, 7, "1815a789"),
+    ("pong", 5_600_000, 200_000, 4, "215a99aa"),
+]
+
+
+@pytest.mark.parametrize("program, cycles, interval, count, digest", _FRAMES)
+def test_should_capture_frames(
+    program: str,
+    cycles: int,
+    interval: int,
+    count: int,
+    digest: str,
+    asm_directory: Path,
+    tmp_path: Path,
+) -> None:
+    executor = Executor.load_from(
+        str(asm_directory.joinpath(f"{program}.asm")), cycles, jit=True
+    )
+    stream = tmp_path.joinpath(f"{program}.n2tf")
+
+    frames = FrameCapture.create(str(stream)).record(executor, interval)
+
+    decoded = list(FrameReader(stream.read_bytes()))
+    assert frames == len(decoded) == count
+    assert decoded[-1][1] == screen_bytes(executor.RAM.words[16384:24576])
+    assert hashlib.sha256(stream.read_bytes()).hexdigest()[:8] == digest
@@ -0,0 +1,79 @@
+import pytest
+
+from n2t.core import Assembler
+from n2t.core.assembler.ir import Kind, Program, Statement
+
+_SOURCE = [
+    "// counts down",
+    "(START)",
+    "  @ n  // variable",
+    "D = M ; JGT",
+    "(START)",
+    "@START",
+    "M D = 1",
+    "@i",
+    "@17",
+    "0;JMP",
+]
+
+
+def test_should_parse_source_into_statements_and_labels() -> None:
+    program = Program.parse(_SOURCE)
+
+    assert program.statements == [
+        Statement(Kind.SYMBOL, "n"),
+        Statement(Kind.COMMAND, comp="M", jump="JGT", dest="D"),
+        Statement(Kind.SYMBOL, "START"),
+        Statement(Kind.COMMAND, dest="DM", comp="1"),
+        Statement(Kind.SYMBOL, "i"),
+        Statement(Kind.LITERAL, "17"),
+        Statement(Kind.COMMAND, comp="0", jump="JMP"),
+    ]
+    assert program.labels == {"START": 0}
+
+
+def test_should_assemble_from_single_pass_over_generator() -> None:
+    words = Assembler.create().assemble(line for line in _SOURCE)
+
+    assert list(words) == [
+        "0000000000010000",
+        "1111110000010001",
+        "0000000000000000",
+        "1110111111011000",
+        "0000000000010001",
+        "0000000000010001",
+        "1110101010000111",
+    ]
+
+
+@pytest.mark.parametrize(
+    "line, word",
+    [
+        ("@0", "0000000000000000"),
+        ("@32767", "0111111111111111"),
+        ("AMD=D|M;JLE", "1111010101111110"),
+        ("D;JGT", "1110001100000001"),
+    ],
+)
+def test_repeated_lines_should_encode_alike(line: str, word: str) -> None:
+    program = Program.parse([line, f" {line} "] * 3)
+
+    assert len({id(statement) for statement in program.statements}) == 2
+    assert list(Assembler.create().assemble([line] * 3)) == [word] * 3
+
+
+def test_stream_should_match_assemble() -> None:
+    assembler = Assembler.create()
+
+    streamed = assembler.stream(_SOURCE)
+
+    assert list(streamed) == list(assembler.assemble(_SOURCE))
+    assert Program.parse(_SOURCE, keep=False).statements == []
+
+
+def test_parallel_encoding_should_match_serial() -> None:
+    source = _SOURCE * 50
+
+    parallel = Assembler.create(threshold=0, workers=3).assemble(source)
+
+    assert parallel == Assembler.create().assemble(source)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, tuples
+
+from n2t.core import Assembler
+from n2t.core.executor import Memory, decode
+from n2t.infra import Executor
+
+pytest.importorskip("numpy")
+
+from n2t.core.executor.batch import BatchExecutor  # noqa: E402
+
+_MAX = ["@R0", "D=M", "@R1", "D=D-M", "@FIRST", "D;JGT", "@R1", "D=M", "@OUT"]
+_MAX += ["0;JMP", "(FIRST)", "@R0", "D=M", "(OUT)", "@R2", "M=D", "(END)", "@END"]
+_MAX += ["0;JMP"]
+
+
+@given(
+    inputs=lists(
+        tuples(integers(-32768, 32767), integers(-32768, 32767)),
+        min_size=1,
+        max_size=20,
+    )
+)
+def test_batch_should_match_single_executor(inputs: list[tuple[int, int]]) -> None:
+    rom = list(Assembler.create().assemble(_MAX))
+    batch = BatchExecutor.create(decode(rom), [{0: x, 1: y} for x, y in inputs])
+
+    batch.run(30)
+
+    dumps = batch.dump()
+    for row, (x, y) in enumerate(inputs):
+        executor = Executor("test.hack", rom, 30, Memory.create({0: x, 1: y}))
+        executor.compile()
+        assert dumps[row] == executor.RAM.dump()
+        assert batch.PC[row] == executor.PC
+
+
+def test_batch_should_retire_lanes_in_halt_loops() -> None:
+    rom = list(Assembler.create().assemble(_MAX))
+    inputs = [{0: 3, 1: 7}, {0: 9, 1: -2}]
+    batch = BatchExecutor.create(decode(rom), inputs)
+
+    batch.run(-1)
+
+    assert batch.halted.all()
+    dumps = batch.dump()
+    for row, ram in enumerate(inputs):
+        executor = Executor("test.hack", rom, -1, Memory.create(ram))
+        executor.compile()
+        assert executor.halted
+        assert dumps[row] == executor.RAM.dump()
+        assert batch.PC[row] == executor.PC
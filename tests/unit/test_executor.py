@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, one_of, sampled_from, tuples
+
+from n2t.core import Assembler
+from n2t.core.executor import Memory
+from n2t.core.executor.affine import skip_iterations
+from n2t.core.executor.decoder import ALU, generic_alu
+from n2t.core.executor.idioms import IDIOMS
+from n2t.core.executor.snapshot import Snapshot
+from n2t.infra import Executor
+from n2t.infra.aot import cache_path
+from n2t.infra.io import File
+from tests.unit.strategies import HackAssemblyPair, a_instructions, c_instructions
+
+
+def executor_for(assembly: list[str], cycles: int = -1) -> Executor:
+    return Executor("test.hack", list(Assembler.create().assemble(assembly)), cycles)
+
+
+@given(
+    control=sampled_from(sorted(ALU)),
+    d=integers(min_value=-32768, max_value=32767),
+    y=integers(min_value=-32768, max_value=32767),
+)
+def test_generic_alu_should_match_table(control: int, d: int, y: int) -> None:
+    assert generic_alu(control)(d, y) == ALU[control](d, y)
+
+
+def test_should_compute_max() -> None:
+    executor = executor_for(
+        ["@R0", "D=M", "@R1", "D=D-M", "@FIRST", "D;JGT", "@R1", "D=M", "@OUT", "0;JMP"]
+        + ["(FIRST)", "@R0", "D=M", "(OUT)", "@R2", "M=D"]
+    )
+    executor.RAM.update({0: 7, 1: 12})
+
+    executor.compile()
+
+    assert executor.RAM[2] == 12
+
+
+def test_should_write_memory_through_previous_address() -> None:
+    executor = executor_for(["@SP", "AM=M-1", "D=M"])
+    executor.RAM.update({0: 258, 257: 42})
+
+    executor.compile()
+
+    assert (executor.RAM[0], executor.A, executor.D) == (257, 257, 42)
+
+
+def test_should_stop_after_given_cycles() -> None:
+    executor = executor_for(["@5", "D=A", "@7", "D=D+A"], cycles=2)
+
+    executor.compile()
+
+    assert (executor.A, executor.D) == (5, 5)
+
+
+def test_should_wrap_to_sixteen_bits() -> None:
+    executor = executor_for(["@32767", "D=A", "D=D+1", "@R0", "M=D-1"])
+
+    executor.compile()
+
+    assert (executor.D, executor.RAM[0]) == (-32768, 32767)
+
+
+def test_should_dump_only_non_zero_words_in_ranges() -> None:
+    memory = Memory.create({0: 256, 3: -1, 16384: 7})
+
+    assert memory.dump() == {0: 256, 3: -1, 16384: 7}
+    assert memory.dump([range(1, 10)]) == {3: -1}
+    assert memory.to_bytes([range(3, 5)]) == b"\xff\xff\x00\x00"
+
+
+@given(
+    instructions=lists(one_of(a_instructions(), c_instructions()), max_size=40),
+    cycles=integers(min_value=0, max_value=200),
+)
+def test_blocks_should_match_interpreter(
+    instructions: list[HackAssemblyPair], cycles: int
+) -> None:
+    rom = [instruction.hack for instruction in instructions]
+    interpreted = Executor("test.hack", rom, cycles, Memory.create({0: 3}))
+    compiled = Executor("test.hack", rom, cycles, Memory.create({0: 3}), jit=True)
+
+    interpreted.compile()
+    compiled.compile()
+
+    assert (compiled.A, compiled.D, compiled.PC) == (
+        interpreted.A,
+        interpreted.D,
+        interpreted.PC,
+    )
+    assert compiled.RAM.dump() == interpreted.RAM.dump()
+
+
+@given(
+    idioms=lists(
+        tuples(integers(min_value=0, max_value=40), sampled_from(IDIOMS)), max_size=20
+    ),
+    cycles=integers(min_value=0, max_value=200),
+)
+def test_macros_should_match_single_steps(
+    idioms: list[tuple[int, tuple[str, ...]]], cycles: int
+) -> None:
+    assembly = [line for value, idiom in idioms for line in [f"@{value}", *idiom]]
+    fused = executor_for(assembly, cycles)
+    stepped = executor_for(assembly, cycles)
+    stepped.macros = [None] * len(stepped.macros)
+    for executor in (fused, stepped):
+        executor.RAM.update({0: 20, 1: 30, 2: 5})
+        executor.compile()
+
+    assert fused.snapshot() == stepped.snapshot()
+
+
+def test_cached_program_should_be_rebuilt_when_source_changes(tmp_path: Path) -> None:
+    source = tmp_path.joinpath("add.asm")
+    source.write_text("@2\nD=A\n@3\nD=D+A\n@R0\nM=D\n")
+    first = Executor.load_from(str(source), -1, cached=True)
+    first.compile()
+    source.write_text("@2\nD=A\n@R0\nM=D\n")
+
+    second = Executor.load_from(str(source), -1, cached=True)
+    second.compile()
+
+    assert (first.RAM[0], second.RAM[0]) == (5, 2)
+    assert cache_path(source).exists()
+
+
+def test_cached_program_should_restore_analysis(tmp_path: Path) -> None:
+    source = tmp_path.joinpath("pong.asm")
+    source.write_text(Path("tests/e2e/asm/pong.asm").read_text())
+    Executor.load_from(str(source), 0, cached=True)
+
+    cached = Executor.load_from(str(source), 0, cached=True)
+    fresh = Executor.load_from(str(source), 0)
+
+    assert cached.analysis == fresh.analysis
+    assert list(cached.ROM) == list(fresh.ROM)
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_should_halt_on_terminal_loop(jit: bool) -> None:
+    executor = executor_for(["@7", "D=A", "@R0", "M=D", "(END)", "@END", "0;JMP"])
+    executor.jit = jit
+
+    executor.compile()
+
+    assert (executor.halted, executor.cycle, executor.PC) == (True, 6, 4)
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_should_halt_on_loop_rewriting_same_values(jit: bool) -> None:
+    executor = executor_for(["(END)", "@R1", "M=1", "D=M", "@END", "D;JGT"])
+    executor.jit = jit
+
+    executor.compile()
+
+    assert (executor.halted, executor.cycle, executor.RAM[1]) == (True, 5, 1)
+
+
+def test_should_not_halt_on_keyboard_polling_loop() -> None:
+    executor = executor_for(["(WAIT)", "@KBD", "D=M", "@WAIT", "D;JEQ"], cycles=100)
+
+    executor.compile()
+
+    assert (executor.halted, executor.cycle) == (False, 100)
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_resumed_run_should_match_uninterrupted_run(jit: bool) -> None:
+    pong: list[str] = list(File(Path("tests/e2e/asm/pong.asm")).load())
+    uninterrupted = executor_for(pong, cycles=20000)
+    uninterrupted.compile()
+    first = executor_for(pong, cycles=12345)
+    first.compile()
+
+    resumed = executor_for(pong, cycles=20000 - 12345)
+    resumed.jit = jit
+    resumed.restore(Snapshot.from_bytes(first.snapshot().to_bytes()))
+    resumed.compile()
+
+    assert resumed.snapshot() == uninterrupted.snapshot()
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_stepped_run_should_match_uninterrupted_run(jit: bool) -> None:
+    pong: list[str] = list(File(Path("tests/e2e/asm/pong.asm")).load())
+    uninterrupted = executor_for(pong, cycles=20000)
+    uninterrupted.compile()
+    stepped = executor_for(pong, cycles=20000)
+    stepped.jit = jit
+
+    cycles = list(stepped.steps(3000))
+
+    assert cycles == [*range(3000, 20000, 3000), 20000]
+    assert stepped.snapshot() == uninterrupted.snapshot()
+
+
+def test_should_not_restore_snapshot_of_another_rom() -> None:
+    snapshot = executor_for(["@R0", "M=1"]).snapshot()
+
+    with pytest.raises(ValueError, match="different ROM"):
+        executor_for(["@R1", "M=1"]).restore(snapshot)
+
+
+@pytest.mark.parametrize("data", [b"", b"N2TS\x01", b"N2TS\x01" + bytes(49) + b"x"])
+def test_should_reject_malformed_snapshots(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        Snapshot.from_bytes(data)
+
+
+_FILL = ["@8192", "D=A", "@n", "M=D", "@i", "M=0", "(LOOP)", "@i", "D=M", "@SCREEN"]
+_FILL += ["A=D+A", "M=-1", "@i", "M=M+1", "D=M", "@n", "D=D-M", "@LOOP", "D;JLT"]
+_COPY = ["@100", "D=A", "@n", "M=D", "(LOOP)", "@n", "D=M", "@1000", "A=D+A", "D=M"]
+_COPY += ["@n", "A=M", "A=A+1", "M=D", "@n", "MD=M-1", "@LOOP", "D;JGT"]
+
+
+@pytest.mark.parametrize("assembly", [_FILL, _COPY])
+@pytest.mark.parametrize("cycles", [-1, 17, 54321])
+@pytest.mark.parametrize("jit", [False, True])
+def test_skipped_loop_should_match_single_steps(
+    assembly: list[str], cycles: int, jit: bool
+) -> None:
+    skipped = executor_for(assembly, cycles)
+    stepped = executor_for(assembly, cycles)
+    stepped.skip_loop = lambda header, a, d, budget: (a, d, 0)  # type: ignore
+    for executor in (skipped, stepped):
+        executor.jit = jit
+        executor.RAM.update({1000 + i: i * 7 - 300 for i in range(120)})
+        executor.compile()
+
+    assert skipped.snapshot() == stepped.snapshot()
+
+
+@pytest.mark.parametrize(
+    "assembly", [_FILL, _COPY, ["@100", "0;JMP"], ["@32767", "D=A", "0;JMP"]]
+)
+def test_unbounded_run_should_match_bounded_run(assembly: list[str]) -> None:
+    unbounded = executor_for(assembly, -1)
+    bounded = executor_for(assembly, 1_000_000)
+    for executor in (unbounded, bounded):
+        executor.RAM.update({1000 + i: i * 7 - 300 for i in range(120)})
+        executor.compile()
+
+    assert unbounded.halted
+    assert unbounded.snapshot() == bounded.snapshot()
+    assert "padded" in vars(unbounded) and "padded" not in vars(bounded)
+
+
+def test_unbounded_run_should_halt_past_rom_size() -> None:
+    unbounded = Executor("long.hack", ["1110011111010000"] * 40_000, -1)
+    bounded = Executor("long.hack", ["1110011111010000"] * 40_000, 50_000)
+
+    unbounded.compile()
+    bounded.compile()
+
+    assert unbounded.halted and bounded.halted
+    assert unbounded.snapshot() == bounded.snapshot()
+
+
+@pytest.mark.parametrize("mode", ["plain", "jit", "profile", "heatmap"])
+def test_any_negative_budget_should_run_to_halt(mode: str) -> None:
+    executor = Executor.load_from(
+        "tests/e2e/asm/rect.asm",
+        -5,
+        jit=mode == "jit",
+        profile=mode == "profile",
+        heatmap=mode == "heatmap",
+    )
+    reference = Executor.load_from("tests/e2e/asm/rect.asm", -1)
+    for run in (executor, reference):
+        run.RAM.update({0: 10})
+        run.compile()
+
+    assert executor.halted
+    assert executor.snapshot() == reference.snapshot()
+
+
+def test_should_skip_fill_loop_in_one_step() -> None:
+    executor = executor_for(_FILL)
+    executor.RAM.update({16: 8192})
+
+    skipped = skip_iterations(executor.program, 6, 0, 0, executor.RAM.words, -1)
+
+    assert skipped is not None and skipped[2] == 8191 * 12
+    assert executor.RAM[17] == 8191
+    assert executor.RAM.dump([range(16384, 24576)]) == {
+        address: -1 for address in range(16384, 16384 + 8191)
+    }
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from hypothesis import given
+from hypothesis.strategies import dictionaries, integers
+
+from n2t.core import Assembler
+from n2t.core.executor.screen import (
+    MAGIC,
+    ROW_BYTES,
+    SCREEN_WORDS,
+    FrameReader,
+    ScreenTracker,
+    encode_frame,
+    render_pbm,
+    screen_bytes,
+)
+from n2t.infra import Executor
+from n2t.infra.frames import FrameCapture
+
+
+def test_pbm_should_put_lowest_bit_leftmost() -> None:
+    words = [0] * SCREEN_WORDS
+    words[0] = 0b1_0000_0011
+
+    image = render_pbm(words)
+
+    assert image[:11] == b"P4\n512 256\n"
+    assert image[11:13] == b"\xc0\x80"
+
+
+@given(dictionaries(integers(0, SCREEN_WORDS - 1), integers(-32768, 32767)))
+def test_tracked_rows_should_rebuild_screen(changes: dict[int, int]) -> None:
+    words = [0] * SCREEN_WORDS
+    tracker = ScreenTracker()
+    stream = MAGIC + encode_frame(0, tracker.changes(words))
+    for address, value in changes.items():
+        words[address] = value
+
+    rows = tracker.changes(words)
+    stream += encode_frame(1, rows)
+
+    assert {row for row, _ in rows} == {
+        address // (ROW_BYTES // 2) for address, value in changes.items() if value
+    }
+    assert list(FrameReader(stream))[-1] == (1, screen_bytes(words))
+
+
+def test_capture_should_record_changed_frames_only(tmp_path: Path) -> None:
+    fill = ["@i", "M=M+1", "D=M", "@SCREEN", "A=D+A", "M=-1", "@0", "0;JMP"]
+    rom = list(Assembler.create().assemble(fill))
+    executor = Executor("fill.hack", rom, 100)
+    capture = FrameCapture.create(str(tmp_path.joinpath("fill.n2tf")))
+
+    frames = capture.record(executor, 40)
+
+    decoded = list(FrameReader(tmp_path.joinpath("fill.n2tf").read_bytes()))
+    assert frames == len(decoded) == 3
+    assert [cycle for cycle, _ in decoded] == [40, 80, 100]
+    assert decoded[-1][1] == screen_bytes(executor.RAM.words[16384:24576])
@@ -0,0 +1,74 @@
+from n2t.core import Assembler
+from n2t.core.executor import Memory
+from n2t.core.executor.heatmap import REGIONS, Heatmap, RegionUsage, render_heatmap
+from n2t.infra import Executor
+
+_PUSH_POP = ["@3000", "D=A", "@SP", "AM=M+1", "A=A-1", "M=D", "@SP", "AM=M+1"]
+_PUSH_POP += ["A=A-1", "M=D", "@SP", "AM=M-1", "D=M", "@2100", "M=D", "@17", "M=D"]
+
+
+def counted(cycles: int = -1) -> Executor:
+    rom = list(Assembler.create().assemble(_PUSH_POP))
+    executor = Executor("push.hack", rom, cycles, Memory.create({0: 256}))
+    executor.heatmap = Heatmap.create()
+    return executor
+
+
+def test_should_count_accesses_and_high_water_marks() -> None:
+    executor = counted()
+
+    executor.compile()
+
+    heatmap = executor.heatmap
+    assert heatmap is not None
+    assert (heatmap.max_sp, heatmap.heap_top, executor.RAM[0]) == (258, 2100, 257)
+    assert (heatmap.reads[0], heatmap.writes[0]) == (3, 3)
+    assert [heatmap.usage(region) for region in REGIONS[:4]] == [
+        RegionUsage(REGIONS[0], 3, 3, 1, 0),
+        RegionUsage(REGIONS[1], 0, 1, 1, 17),
+        RegionUsage(REGIONS[2], 1, 2, 2, 257),
+        RegionUsage(REGIONS[3], 0, 1, 1, 2100),
+    ]
+
+
+def test_counted_run_should_match_plain_run() -> None:
+    plain = counted(11)
+    plain.heatmap = None
+    executor = counted(11)
+
+    plain.compile()
+    executor.compile()
+
+    assert executor.snapshot() == plain.snapshot()
+
+
+def test_report_should_summarise_regions() -> None:
+    executor = counted()
+    executor.compile()
+    assert executor.heatmap is not None
+
+    report = render_heatmap(executor.heatmap, limit=1)
+
+    assert [line.split()[0] for line in report[2:9]] == [
+        region.name for region in REGIONS
+    ]
+    assert "Max SP 258 (2 of 1792 stack words)" in report
+    assert report[-1].split() == ["0", "registers", "3", "3"]
+
+
+def test_should_count_accesses_past_the_keyboard() -> None:
+    rom = list(Assembler.create().assemble(["@30000", "M=1", "D=M"]))
+    executor = Executor("far.hack", rom, -1)
+    executor.heatmap = Heatmap.create()
+
+    executor.compile()
+
+    assert executor.heatmap.usage(REGIONS[-1]) == RegionUsage(
+        REGIONS[-1], 1, 1, 1, 30000
+    )
+    assert render_heatmap(executor.heatmap)[-1].split() == [
+        "30000",
+        "unmapped",
+        "1",
+        "1",
+    ]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from n2t.core import Assembler
+from n2t.core.executor.history import ENTRY_BYTES, History
+from n2t.infra import Executor
+from n2t.infra.io import File
+
+_PONG: list[str] = list(
+    Assembler.create().assemble(list(File(Path("tests/e2e/asm/pong.asm")).load()))
+)
+
+
+def pong(cycles: int, history: History | None = None) -> Executor:
+    executor = Executor("pong.hack", _PONG, cycles, history=history)
+    executor.RAM[0] = 256
+    return executor
+
+
+@pytest.mark.parametrize("budget", [1 << 20, 8 * 1024])
+@pytest.mark.parametrize("back", [1, 37, 999, 4321])
+def test_step_back_should_rebuild_earlier_state(budget: int, back: int) -> None:
+    recorded = pong(10000, History.create(interval=1000, budget=budget))
+    recorded.compile()
+    expected = pong(10000 - back)
+    expected.compile()
+
+    recorded.step_back(back)
+
+    assert recorded.snapshot() == expected.snapshot()
+
+
+def test_history_should_stay_within_budget() -> None:
+    history = History.create(interval=500, budget=8 * 1024)
+    executor = pong(20000, history)
+
+    executor.compile()
+
+    assert history.size == history.capacity == 4 * 1024 // ENTRY_BYTES
+    assert history.snapshot_bytes <= 4 * 1024
+    with pytest.raises(ValueError, match="no longer in history"):
+        executor.step_back(20000)
+
+
+def test_step_back_should_leave_terminal_loop() -> None:
+    assembly = ["@7", "D=A", "@R0", "M=D", "(END)", "@END", "0;JMP"]
+    rom = list(Assembler.create().assemble(assembly))
+    recorded = Executor("end.hack", rom, -1, history=History.create(100, 1 << 16))
+    recorded.compile()
+    expected = Executor("end.hack", rom, recorded.cycle - 3)
+    expected.compile()
+
+    recorded.step_back(3)
+
+    assert recorded.snapshot() == expected.snapshot()
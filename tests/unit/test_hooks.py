@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from n2t.core import Assembler
+from n2t.core.executor import Memory
+from n2t.core.executor.profile import SourceMap
+from n2t.infra import Executor
+
+_OS = [
+    "(END)",
+    "@END",
+    "0;JMP",
+    "(Math.multiply)",
+    "@5",
+    "0;JMP",
+    "(Math.divide)",
+    "@5",
+    "0;JMP",
+]
+
+
+def executor_at(routine: str, x: int, y: int, jit: bool) -> Executor:
+    rom = list(Assembler.create().assemble(_OS))
+    frame = {295: 0, 296: 111, 297: 222, 298: 333, 299: 444}
+    ram = Memory.create({0: 300, 1: 300, 2: 293, 293: x, 294: y, **frame})
+    labels = SourceMap.from_assembly(_OS).labels
+    entry = next(address for address, label in labels if label == routine)
+    executor = Executor("os.hack", rom, 1, ram, PC=entry, jit=jit)
+    executor.install_hooks(labels)
+    return executor
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_hook_should_return_to_caller(jit: bool) -> None:
+    executor = executor_at("Math.multiply", 6, -7, jit)
+
+    executor.compile()
+
+    assert (executor.PC, executor.cycle) == (0, 1)
+    assert executor.RAM.dump([range(0, 5), range(293, 294)]) == {
+        0: 294,
+        1: 111,
+        2: 222,
+        3: 333,
+        4: 444,
+        293: -42,
+    }
+    assert sum(executor.hooked.values()) == 1
+
+
+def test_declined_hook_should_run_routine() -> None:
+    executor = executor_at("Math.divide", 6, 0, jit=False)
+
+    executor.compile()
+
+    assert (executor.PC, executor.A, executor.RAM[0]) == (5, 5, 300)
+    assert not executor.hooked
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from n2t.core.executor import Instruction
+from n2t.core.executor.analysis import Analysis
+from n2t.infra.jobs import Job, load_manifest, run_job, run_jobs, share
+
+
+def test_should_run_every_manifest_job(tmp_path: Path) -> None:
+    tmp_path.joinpath("max.asm").write_text(
+        "@R0\nD=M\n@R1\nD=D-M\n@FIRST\nD;JGT\n@R1\nD=M\n@OUT\n0;JMP\n"
+        "(FIRST)\n@R0\nD=M\n(OUT)\n@R2\nM=D\n"
+    )
+    manifest = tmp_path.joinpath("jobs.jsonl")
+    manifest.write_text(
+        "\n".join(
+            json.dumps({"program": "max.asm", "ram": {"0": x, "1": 10 - x}})
+            for x in range(6)
+        )
+    )
+
+    results = list(run_jobs(load_manifest(str(manifest)), workers=2))
+
+    assert sorted((result["job"], result["RAM"][2]) for result in results) == [
+        (x, max(x, 10 - x)) for x in range(6)
+    ]
+
+
+def test_should_play_job_keys(tmp_path: Path) -> None:
+    tmp_path.joinpath("echo.asm").write_text(
+        "(LOOP)\n@KBD\nD=M\n@R0\nM=D\n@LOOP\n0;JMP\n"
+    )
+    manifest = tmp_path.joinpath("jobs.jsonl")
+    manifest.write_text(
+        json.dumps({"program": "echo.asm", "cycles": 600, "keys": ["500 left"]})
+    )
+
+    (result,) = run_jobs(load_manifest(str(manifest)), workers=1)
+
+    assert result["RAM"][0] == 130
+
+
+def test_should_analyse_each_program_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    program = str(tmp_path.joinpath("count.hack"))
+    share({program: ["0000000000010000", "1111110111001000"]})
+    analysed: list[int] = []
+    original = Analysis.of
+
+    def counting(program: list[Instruction]) -> Analysis:
+        analysed.append(len(program))
+        return original(program)
+
+    monkeypatch.setattr(Analysis, "of", counting)
+
+    results = [run_job(Job(index, program, 2), False) for index in range(3)]
+
+    assert analysed == [2]
+    assert [result["RAM"][16] for result in results] == [1, 1, 1]
@@ -0,0 +1,41 @@
+import pytest
+
+from n2t.core import Assembler
+from n2t.core.executor.keyboard import KeyEvent, parse_script
+from n2t.infra import Executor
+
+_WAIT_FOR_KEY = ["(WAIT)", "@KBD", "D=M", "@WAIT", "D;JEQ", "@R0", "M=D"]
+_WAIT_FOR_KEY += ["(UP)", "@KBD", "D=M", "@UP", "D;JNE", "@R1", "M=1"]
+_WAIT_FOR_KEY += ["(END)", "@END", "0;JMP"]
+
+
+def test_should_parse_key_script() -> None:
+    script = ["# cycle key [hold]", "", "300 left 50", "100 A", "200 release"]
+
+    assert parse_script(script) == [
+        KeyEvent(100, 65),
+        KeyEvent(200, 0),
+        KeyEvent(300, 130),
+        KeyEvent(350, 0),
+    ]
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_should_press_and_release_keys_on_cycle(jit: bool) -> None:
+    rom = list(Assembler.create().assemble(_WAIT_FOR_KEY))
+    executor = Executor("keys.hack", rom, -1, jit=jit)
+
+    executor.play(parse_script(["1000 up 500"]))
+
+    assert (executor.halted, executor.cycle) == (True, 1510)
+    assert executor.RAM.dump([range(0, 2)]) == {0: 131, 1: 1}
+
+
+def test_steps_should_stop_at_intervals_and_events() -> None:
+    rom = list(Assembler.create().assemble(_WAIT_FOR_KEY))
+    executor = Executor("keys.hack", rom, 2500)
+
+    cycles = list(executor.steps(1000, [KeyEvent(1200, 75), KeyEvent(1700, 0)]))
+
+    assert (cycles, executor.halted) == ([1000, 1710], True)
+    assert executor.RAM.dump([range(0, 2)]) == {0: 75, 1: 1}
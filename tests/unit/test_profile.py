@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from n2t.core import Assembler
+from n2t.core.executor.profile import Profile, SourceMap
+from n2t.infra import Executor
+
+_COUNTDOWN = [
+    "// counts R0 down to zero",
+    "@3",
+    "D=A",
+    "@R0",
+    "M=D",
+    "(LOOP)",
+    "@R0",
+    "MD=M-1",
+    "@LOOP",
+    "D;JGT",
+]
+
+
+def test_should_count_hits_and_branches() -> None:
+    rom = list(Assembler.create().assemble(_COUNTDOWN))
+    executor = Executor("countdown.hack", rom, -1, profile=Profile.create(len(rom)))
+
+    executor.compile()
+
+    assert executor.profile is not None
+    assert executor.profile.hits == [1, 1, 1, 1, 3, 3, 3, 3]
+    assert (executor.profile.taken[7], executor.profile.not_taken[7]) == (2, 1)
+    assert executor.profile.loops(executor.program)[0][:3] == (4, 7, 2)
+
+
+def test_should_describe_addresses_with_labels_and_lines() -> None:
+    source = SourceMap.from_assembly(_COUNTDOWN)
+
+    assert source.describe(1) == "1 (line 3: D=A)"
+    assert source.describe(4) == "LOOP (line 7: @R0)"
+    assert source.describe(7) == "LOOP+3 (line 10: D;JGT)"
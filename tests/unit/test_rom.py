@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from n2t.core.executor import decode, decode_words
+from n2t.infra import HackProgram
+from n2t.infra.executor import Executor
+from n2t.infra.io import File
+from n2t.infra.rom import PackedRom, convert_rom, load_rom
+
+_PONG = Path("tests/e2e/asm/pong.asm")
+
+
+def packed_pong(tmp_path: Path) -> Path:
+    hack = tmp_path.joinpath("pong.hack")
+    File(hack).save(load_rom(_PONG))
+    return convert_rom(hack)
+
+
+def test_packed_rom_should_store_little_endian_words(tmp_path: Path) -> None:
+    hack = tmp_path.joinpath("words.hack")
+    File(hack).save(["0000000000000001", "1110110000010000", ""])
+
+    packed = convert_rom(hack)
+
+    assert packed.read_bytes() == b"\x01\x00\x10\xec"
+    assert list(PackedRom.load(packed)) == ["0000000000000001", "1110110000010000"]
+
+
+def test_packed_rom_should_round_trip_to_text(tmp_path: Path) -> None:
+    packed = packed_pong(tmp_path)
+    packed.with_suffix(".hack").unlink()
+
+    text = convert_rom(packed)
+
+    assert list(File(text).load()) == list(load_rom(_PONG))
+
+
+def test_packed_rom_should_decode_like_text(tmp_path: Path) -> None:
+    rom = PackedRom.load(packed_pong(tmp_path))
+
+    assert decode_words(rom.words) == decode(load_rom(_PONG))
+    assert rom[1:3] == list(load_rom(_PONG))[1:3]
+    assert pickle.loads(pickle.dumps(rom)) == PackedRom.from_bytes(rom.to_bytes())
+
+
+def test_executor_should_run_packed_rom(tmp_path: Path) -> None:
+    packed = Executor.load_from(str(packed_pong(tmp_path)), 50_000)
+    text = Executor.load_from(str(_PONG), 50_000)
+
+    packed.compile()
+    text.compile()
+
+    assert packed.snapshot() == text.snapshot()
+
+
+@pytest.mark.parametrize("name", ["pong.txt", "pong.asm", "pong.hackz"])
+def test_should_reject_files_that_are_not_roms(name: str) -> None:
+    with pytest.raises(ValueError, match=r"Expected a \.hack or \.hackb file"):
+        HackProgram.load_from(name)
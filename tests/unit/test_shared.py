@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from n2t.core import Assembler
+from n2t.core.executor.screen import HEIGHT, SCREEN_WORDS, WIDTH, render_ppm
+from n2t.infra import Executor
+from n2t.infra.shared import SharedRAM
+from n2t.infra.viewer import ScreenViewer
+
+_ECHO = ["@KBD", "D=M", "@SCREEN", "M=D", "@R0", "M=D"]
+
+
+def test_shared_ram_should_expose_screen_and_keyboard() -> None:
+    rom = list(Assembler.create().assemble(_ECHO))
+    executor = Executor("echo.hack", rom, -1)
+
+    with executor.sharing() as shared:
+        viewer = SharedRAM.attach(shared.name)
+        viewer.press(75)
+        executor.compile()
+        with viewer.screen() as screen:
+            assert screen[0] == 75
+        viewer.close()
+
+    assert executor.RAM.dump() == {0: 75, 16384: 75, 24576: 75}
+
+
+def test_should_render_screen_as_ppm() -> None:
+    words = [0] * SCREEN_WORDS
+    words[0] = 0b101
+    words[-1] = -32768
+
+    image = render_ppm(words)
+
+    header, pixels = image[:15], image[15:]
+    assert header == f"P6\n{WIDTH} {HEIGHT}\n255\n".encode()
+    assert len(pixels) == 3 * WIDTH * HEIGHT
+    assert pixels[:9] == b"\x00\x00\x00\xff\xff\xff\x00\x00\x00"
+    assert pixels[-6:] == b"\xff\xff\xff\x00\x00\x00"
+
+
+def test_viewer_should_write_changed_frames_only(tmp_path: Path) -> None:
+    shared = SharedRAM.create()
+    viewer = ScreenViewer.attach(shared.name, str(tmp_path))
+
+    first = viewer.capture()
+    unchanged = viewer.capture()
+    shared.words[16384] = 1
+    second = viewer.capture()
+
+    viewer.close()
+    shared.close()
+    assert (first, unchanged, second) == (
+        tmp_path.joinpath("frame_00000.ppm"),
+        None,
+        tmp_path.joinpath("frame_00001.ppm"),
+    )
@@ -0,0 +1,62 @@
+import pytest
+
+from n2t.core import Assembler
+from n2t.core.executor.watch import Hit, Watches, parse_predicate
+from n2t.infra import Executor
+
+_COUNT = ["@R1", "M=0", "(LOOP)", "@R0", "D=M", "@R1", "M=M+1", "D=D-M"]
+_COUNT += ["@LOOP", "D;JGT", "@R2", "M=1"]
+
+
+def watched(watches: Watches, cycles: int = -1) -> Executor:
+    rom = list(Assembler.create().assemble(_COUNT))
+    executor = Executor("count.hack", rom, cycles, watches=watches)
+    executor.RAM[0] = 5
+    return executor
+
+
+def test_should_stop_before_breakpoint_and_resume_past_it() -> None:
+    executor = watched(Watches.create(breakpoints=[10]))
+
+    executor.compile()
+    stopped = (executor.hit, executor.RAM[2])
+    executor.compile()
+
+    assert stopped == (Hit("breakpoint 10", 38, 10), 0)
+    assert (executor.hit, executor.halted, executor.RAM[2]) == (None, True, 1)
+
+
+def test_should_stop_after_watched_access() -> None:
+    reads = watched(Watches.create(reads=[0]))
+    writes = watched(Watches.create(writes=[2]))
+
+    reads.compile()
+    first = reads.hit
+    reads.compile()
+    writes.compile()
+
+    assert (first, reads.hit) == (
+        Hit("read of RAM[0]", 4, 4),
+        Hit("read of RAM[0]", 11, 4),
+    )
+    assert writes.hit == Hit("write of 1 to RAM[2]", 39, 11)
+
+
+@pytest.mark.parametrize(
+    "predicate, cycle", [("RAM[1] == 3", 20), ("D == 1", 28), ("PC >= 11", 39)]
+)
+def test_should_stop_when_predicate_holds(predicate: str, cycle: int) -> None:
+    executor = watched(Watches.create(predicates=[predicate]))
+
+    executor.compile()
+
+    assert executor.hit == Hit(predicate, cycle, executor.PC)
+    assert parse_predicate(predicate).holds(
+        executor.RAM.words, executor.A, executor.D, executor.PC
+    )
+
+
+@pytest.mark.parametrize("text", ["RAM[x] == 1", "Q == 1", "RAM[0] = 1"])
+def test_should_reject_malformed_predicate(text: str) -> None:
+    with pytest.raises(ValueError, match="Expected"):
+        parse_predicate(text)